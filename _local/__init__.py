@@ -2,5 +2,7 @@ from .multiset42 import Multiset
 from .cube import Cube
 from . import codec_v1
 from . import codec_v2
+from . import codec_v3
+from . import container
 
-__all__ = ['Cube', 'Multiset', 'codec_v1', 'codec_v2']
+__all__ = ['Cube', 'Multiset', 'codec_v1', 'codec_v2', 'codec_v3', 'container']
@@ -3,24 +3,41 @@ from .cube import Cube
 from .ranking import _A50
 from ._fix_windows_console import fix_console_encoding
 
+import argparse
+from contextlib import contextmanager
+import json
+import mmap
 from pathlib import Path
 import re
 import sys
 
 # TODO tkinter dialogue
 
+def _text_to_str50(text):
+  # Simple text is upper-cased; paragraphs are separated by \x1E, and any
+  # other character outside the alphabet is escaped as \x1BW + UTF-16LE hex
+  x = text.replace('\n', '\x1E').upper()
+  return re.sub(rf'[^{re.escape(_A50)}]', lambda m: re.sub(r'....', lambda m: f'\x1bW{m[0]}', m[0].encode('utf-16le', errors='surrogateescape').hex().upper()), x)
+
+
+def _str50_to_text(x):
+  # Inverse of _text_to_str50 (but for the upper-casing)
+  x = re.sub(r'(?:\x1bW[0-9A-F]{4})+', lambda m: bytes.fromhex(m[0].replace('\x1bW', '')).decode('utf-16le', errors='surrogateescape'), x)
+  return x.replace('\x1E', '\n')
+
+
 def encode():
   arg1 = sys.argv[1] if len(sys.argv) > 1 else None
   if arg1 is None:
     x = input('Do you want to send a file, or a simple text message?\nType "50" and press Enter for simple text; or type "f" and press Enter for a file.\n> ')
     if x == '50':
       print('type your message\n(Only alphanumerics. Enter one paragraph per line, and a blank line when done.)')
-      x = '\x1E'.join(iter(lambda: input('> '), '')).upper()
-      x = re.sub(rf'[^{re.escape(_A50)}]', lambda m: re.sub(r'....', lambda m: f'\x1bW{m[0]}', m[0].encode('utf-16le', errors='surrogateescape').hex().upper()), x)
+      x = _text_to_str50('\n'.join(iter(lambda: input('> '), '')))
       cs = str50_to_cubes(x)
     elif x == 'f':
       p = Path(input('specify the file path.\n> '))
-      bytes_to_cubes(p.read_bytes())
+      with _mapped(p) as data:
+        cs = bytes_to_cubes(data)
     else:
       raise ValueError()
   else:
@@ -29,29 +46,214 @@ def encode():
     if p.suffix in {'.txt', '.TXT'}:
       cs = str50_to_cubes(p.read_text())
     else:
-      cs = bytes_to_cubes(p.read_bytes())
+      with _mapped(p) as data:
+        cs = bytes_to_cubes(data)
+  cs = list(cs)
+  sequences = Cube.solve_many(cs)
   print('Here are the cubes containing your outbound message:')
-  print('\n'.join(repr(c) for c in cs))
+  print('\n'.join(c._render(sequence) for c, sequence in zip(cs, sequences)))
 
 
 def decode():
   print('Enter, ONE PER LINE, the solverstrings for the cubes you recieved.\n(NOTE for now you MUST use white-up, green-front.)\n(Enter the cubes in any order.)')
   print('Press Enter without any result once you\'ve entered all the cubes.')
-  cs = list(map(Cube, iter(lambda: input('> '), '')))
+  decoder = IncrementalDecoder()
+  for line in iter(lambda: input('> '), ''):
+    try:
+      decoder.add(line.strip())
+    except ValueError as e:
+      print(f'That is not a valid cube ({e}); please re-enter it.')
   x = input('Were you expecting a FILE, or a SIMPLE TEXT message?\nType "50" and press Enter for simple text; or type "f" and press Enter for a file.\n> ')
   if x == '50':
-    m = cubes_to_str50(cs).replace('\x1E', '\n\n').replace('\x1B', '\u241B')
+    m = decoder.finish_str50().replace('\x1E', '\n\n').replace('\x1B', '\u241B')
     print(f'Your message is:\n\n{m}\n')
   elif x == 'f':
-    data = cubes_to_bytes(cs)
     x = input('Enter the path to save the file to\n(WARNING: will be overridden if it exists!)\n> ')
-    p = Path(x)
-    p.write_bytes(data)
+    with open(x, 'wb') as f:
+      decoder.finish(out=f.fileno())
   else:
     raise ValueError()
 
 
+def _parser():
+  parser = argparse.ArgumentParser(prog='python -m _local', description='Encode files as Rubik\'s Cubes, and back. Run without arguments for the interactive mode.')
+  commands = parser.add_subparsers(dest='command', required=True)
+
+  p = commands.add_parser('encode', help='encode a file into cubes')
+  p.add_argument('--in', dest='infile', default='-', metavar='PATH', help='file to encode (default: stdin)')
+  p.add_argument('--out', dest='outfile', default='-', metavar='PATH', help='where to write the cubes (default: stdout)')
+  p.add_argument('--text', action='store_true', help='encode the input as a simple text message (upper-cased; other characters are escaped)')
+  p.add_argument('--format', choices=['render', 'solverstrings', 'jsonl'], default='render', help='render: drawings and move sequences (the default); solverstrings: one per line; jsonl: one JSON object per cube')
+  p.add_argument('--no-render', action='store_true', help='skip the drawings and the solver (render becomes solverstrings; jsonl omits the move sequence)')
+  p.add_argument('--workers', type=int, metavar='N', help='solve cubes in N processes')
+
+  p = commands.add_parser('decode', help='decode cubes back into a file')
+  p.add_argument('--in', dest='infile', default='-', metavar='PATH', help='cubes to decode, in any order (default: stdin)')
+  p.add_argument('--out', dest='outfile', default='-', metavar='PATH', help='where to write the payload (default: stdout)')
+  p.add_argument('--text', action='store_true', help='the cubes hold a simple text message')
+  p.add_argument('--format', choices=['solverstrings', 'jsonl'], default='solverstrings', help='solverstrings: one per line (the default); jsonl: objects with a "solverstring" key, as written by encode')
+
+  p = commands.add_parser('estimate', help='print how many cubes a payload would take, and how long encoding and decoding it would take, without encoding it')
+  group = p.add_mutually_exclusive_group()
+  group.add_argument('--in', dest='infile', default='-', metavar='PATH', help='payload to measure (default: stdin)')
+  group.add_argument('--length', type=int, metavar='N', help='only the payload\'s length is known (bytes; characters with --text, where the bounds allow for any of them needing escapes)')
+  p.add_argument('--text', action='store_true', help='the payload is a simple text message')
+  p.add_argument('--out', dest='outfile', default='-', metavar='PATH', help='where to write the estimate, as JSON (default: stdout)')
+  p.add_argument('--timing', action='store_true', help='also project the encode/decode time (calibrating first, which takes about a second)')
+
+  p = commands.add_parser('serve', help='run the encode/decode service, keeping its tables loaded (see _local/client.py)')
+  p.add_argument('--unix', metavar='PATH', help='listen on this Unix socket, instead of TCP')
+  p.add_argument('--host', default='127.0.0.1', help='(default: %(default)s)')
+  # client.DEFAULT_PORT; not imported from there, as that would load asyncio
+  p.add_argument('--port', type=int, default=8754, help='(default: %(default)s)')
+  p.add_argument('--workers', type=int, metavar='N', help='worker processes (default: one per CPU)')
+  p.add_argument('--batch-delay', type=float, default=5, metavar='MS', help='how long to wait for more requests to batch together (default: %(default)s)')
+  p.add_argument('--max-batch', type=int, default=64, metavar='N', help='requests per batch (default: %(default)s)')
+  p.add_argument('--max-pending', type=int, default=1024, metavar='N', help='requests waiting for a batch, beyond which clients are made to wait (default: %(default)s)')
+
+  commands.add_parser('batch', help='run one command per line of stdin, each a JSON array of arguments with explicit --in and --out paths (e.g. ["encode", "--in", "a.bin", "--out", "a.txt"]); report one JSON line per command on stdout')
+  return parser
+
+
+def _open(path, mode):
+  if path == '-':
+    f = sys.stdin if 'r' in mode else sys.stdout
+    return open(f.fileno(), mode, closefd=False) if 'b' in mode else open(f.fileno(), mode, encoding='utf-8', closefd=False)
+  return open(path, mode) if 'b' in mode else open(path, mode, encoding='utf-8')
+
+
+@contextmanager
+def _mapped(path):
+  # The file's contents, memory-mapped where possible, so they are not copied
+  with _open(path, 'rb') as f:
+    try:
+      m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):  # a pipe, or an empty file
+      yield f.read()
+      return
+    with m:
+      yield m
+
+
+def cmd_encode(args):
+  with _mapped(args.infile) as data:
+    cs = list(str50_to_cubes(_text_to_str50(str(data, 'utf-8'))) if args.text else bytes_to_cubes(data))
+  render = not args.no_render
+  if render and args.format in {'render', 'jsonl'}:
+    sequences = Cube.solve_many(cs, workers=args.workers)
+  with _open(args.outfile, 'w') as f:
+    if args.format == 'render' and render:
+      f.write('\n'.join(c._render(sequence) for c, sequence in zip(cs, sequences)))
+    elif args.format == 'jsonl':
+      for i, c in enumerate(cs):
+        record = {'solverstring': str(c), 'rank': c.rank()}
+        if render:
+          record['creation_sequence'] = sequences[i]
+        f.write(json.dumps(record) + '\n')
+    else:
+      f.writelines(f'{c}\n' for c in cs)
+
+
+def cmd_decode(args):
+  decoder = IncrementalDecoder()
+  with _open(args.infile, 'r') as f:
+    for lineno, line in enumerate(f, 1):
+      line = line.strip()
+      if not line:
+        continue
+      try:
+        if args.format == 'jsonl':
+          line = json.loads(line)['solverstring']
+          if not isinstance(line, str):
+            raise TypeError(f'solverstring is not a string: {line!r}')
+        decoder.add(line)
+      except (ValueError, KeyError, TypeError) as e:
+        raise SystemExit(f'{"<stdin>" if args.infile == "-" else args.infile}:{lineno}: not a valid cube ({e!r})')
+  if args.text:
+    with _open(args.outfile, 'w') as f:
+      f.write(_str50_to_text(decoder.finish_str50()))
+  else:
+    sys.stdout.flush()
+    with _open(args.outfile, 'wb') as f:
+      decoder.finish(out=f.fileno())
+
+
+# The most str50 characters one character of text can become: upper() makes
+# up to 3 characters of one, and each outside the alphabet is escaped as 6
+_MAX_ESCAPED_LENGTH = 3 * 6
+
+
+def cmd_estimate(args):
+  codec = 'str50' if args.text else 'bytes'
+  timing = args.timing
+  if args.length is not None:
+    try:
+      if args.text:
+        # Bounded by all-plain text below and all-escaped text above
+        lo = estimate(args.length, codec)
+        result = estimate(args.length * _MAX_ESCAPED_LENGTH, codec, timing=timing)
+        result.update(length=args.length, cubes_min=lo['cubes_min'])
+        result['cubes'] = result['cubes_min'] if result['cubes_min'] == result['cubes_max'] else None
+      else:
+        result = estimate(args.length, codec, timing=timing)
+    except ValueError as e:
+      raise SystemExit(f'estimate: {e}')
+  else:
+    with _mapped(args.infile) as data:
+      result = estimate(_text_to_str50(str(data, 'utf-8')) if args.text else data, codec, timing=timing)
+  with _open(args.outfile, 'w') as f:
+    f.write(json.dumps(result) + '\n')
+
+
+def cmd_serve(args):
+  # deferred: only the service needs the asyncio stack
+  import asyncio
+  from .server import serve
+  print(f'listening on {args.unix or f"{args.host}:{args.port}"}', file=sys.stderr)
+  try:
+    asyncio.run(serve(args.unix, host=args.host, port=args.port, workers=args.workers, batch_delay=args.batch_delay / 1000, max_batch=args.max_batch, max_pending=args.max_pending))
+  except KeyboardInterrupt:
+    pass
+
+
+def cmd_batch(args):
+  # One warm process for many jobs
+  for line in sys.stdin:
+    if not line.strip():
+      continue
+    try:
+      argv = json.loads(line)
+      if not (isinstance(argv, list) and argv and argv[0] not in {'batch', 'serve'}):
+        raise ValueError('expected a JSON array of arguments for encode, decode or estimate')
+      job = _parser().parse_args([str(a) for a in argv])
+      # stdin carries the jobs and stdout the statuses, so neither is free
+      if job.outfile == '-' or job.infile == '-' and getattr(job, 'length', None) is None:
+        raise ValueError('batch jobs need explicit --in and --out paths')
+      COMMANDS[job.command](job)
+    except SystemExit as e:
+      if not e.code:
+        result = {'ok': True}
+      else:
+        result = {'ok': False, 'error': e.code if isinstance(e.code, str) else f'exit status {e.code}'}
+    except Exception as e:
+      result = {'ok': False, 'error': f'{type(e).__name__}: {e}'}
+    else:
+      result = {'ok': True}
+    print(json.dumps(result), flush=True)
+
+
+COMMANDS = {'encode': cmd_encode, 'decode': cmd_decode, 'estimate': cmd_estimate, 'serve': cmd_serve, 'batch': cmd_batch}
+
+
+def main(argv):
+  args = _parser().parse_args(argv)
+  COMMANDS[args.command](args)
+
+
 if __name__ == '__main__':
+  if len(sys.argv) > 1 and (sys.argv[1] in COMMANDS or sys.argv[1].startswith('-')):
+    main(sys.argv[1:])
+    sys.exit()
   fix_console_encoding()
   if input('Do you want to send a message, or recieve one?\nPress ENTER to recieve a message, or type ANYTHING AT ALL then press Enter to send one.\n> '):
     encode()
@@ -0,0 +1,39 @@
+# Generated by `python -m _local._gen_coset_tables` -- do not edit.
+"""Stabilizer chain of Cube.GROUP, as computed by sympy's Schreier-Sims.
+
+The coset order (Cube.rank()) is defined by this chain, so the file pins
+it down independently of the installed sympy.
+"""
+
+FORMAT = 1
+SYMPY_VERSION = '1.14.0'
+
+# The chain is only valid for a group with these generators (U F R B L D)
+GENERATORS = (b'\x06\x03\x00\x07\x04\x01\x08\x05\x02\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\t\n\x0b\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'()*+,-./012345', b'\x00\x01\x02\x03\x04\x05, \x14!\x15\t\x06\r\x0e\x0f\x10\x11\x12\x13-"\x16\n\x07\x19\x1a\x1b\x1c\x1d\x1e\x1f.#\x17\x0b\x08%&\'()*+/$\x18\x0c012345', b'\x00\x01\x0b\x03\x04\x17\x06\x07#\t\n/$\x18\x0c\x08\x10\x11\x12\x13\x14\x15\x162%\x19\r\x05\x1c\x1d\x1e\x1f !"5&\x1a\x0e\x02()*+,-.\'01\x1b34\x0f', b'\x0e\x1a&\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r5\'\x1b\x0f\x02\x13\x14\x15\x16\x17\x18\x194(\x1c\x10\x01\x1f !"#$%3)\x1d\x11\x00+,-./012\x12\x1e*', b')\x01\x02\x1d\x04\x05\x11\x07\x08\x00\n\x0b\x0c\r\x0e\x0f\x103*\x1e\x12\x03\x16\x17\x18\x19\x1a\x1b\x1c0+\x1f\x13\x06"#$%&\'(-, \x14\t./\x1512!45', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f *+,!"#$%&\'()30-41.52/')
+
+ORDER = 43252003274489856000
+BASE = (0, 6, 2, 33, 8, 34, 23, 38, 35, 37, 26, 5, 40, 7, 21, 29, 1, 3)
+# ORBITS[i] is the orbit of BASE[i] under the i-th stabilizer, sorted
+ORBITS = ((0, 2, 6, 8, 9, 11, 12, 14, 15, 17, 18, 20, 33, 35, 36, 38, 39, 41, 42, 44, 45, 47, 51, 53), (2, 6, 8, 9, 11, 12, 14, 15, 20, 33, 35, 36, 38, 39, 41, 42, 44, 45, 47, 51, 53), (2, 8, 11, 12, 14, 15, 33, 35, 36, 38, 39, 41, 42, 44, 45, 47, 51, 53), (8, 11, 12, 33, 35, 36, 38, 39, 41, 42, 44, 45, 47, 51, 53), (8, 11, 12, 35, 36, 38, 39, 41, 42, 47, 51, 53), (1, 3, 5, 7, 10, 13, 16, 19, 21, 23, 24, 26, 27, 29, 30, 32, 34, 37, 40, 43, 46, 48, 50, 52), (1, 3, 5, 7, 10, 13, 16, 19, 21, 23, 24, 26, 27, 29, 30, 32, 37, 40, 43, 48, 50, 52), (35, 36, 38, 39, 41, 42, 47, 51, 53), (35, 36, 41, 42, 47, 51), (1, 3, 5, 7, 10, 13, 16, 19, 21, 26, 27, 29, 30, 32, 37, 40, 43, 48, 50, 52), (1, 3, 5, 7, 10, 13, 16, 19, 21, 26, 27, 29, 30, 32, 40, 43, 48, 52), (1, 3, 5, 7, 10, 13, 16, 19, 21, 29, 30, 32, 40, 43, 48, 52), (1, 3, 7, 10, 16, 19, 21, 29, 30, 32, 40, 43, 48, 52), (1, 3, 7, 10, 16, 19, 21, 29, 30, 32, 43, 48), (1, 3, 16, 19, 21, 29, 30, 32, 43, 48), (1, 3, 16, 19, 29, 30, 43, 48), (1, 3, 16, 19, 43, 48), (3, 19))
+# TRANSVERSALS[i][j] maps BASE[i] to ORBITS[i][j]
+TRANSVERSALS = (
+    (b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'()*+,-./012345', b'\x02\x05\x08\x01\x04\x07\x00\x03\x06\x12\x13\x14\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'()*+,-./012345', b'\x06\x03\x00\x07\x04\x01\x08\x05\x02\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\t\n\x0b\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'()*+,-./012345', b'\x08\x07\x06\x05\x04\x03\x02\x01\x00\x0f\x10\x11\x12\x13\x14\t\n\x0b\x0c\r\x0e\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'()*+,-./012345', b'\t\x01\x02\x15\x04\x05!\x07\x08-\n\x0b\x0c\r\x0e\x0f\x10\x06\x14 ,0\x16\x17\x18\x19\x1a\x1b\x1c\x03\x13\x1f+3"#$%&\'(\x00\x12\x1e*)./\x1d12\x1145', b'\x0b\x01\x02\x1d\x04\x05\x11\x07&\x00\n5\'\r\x0e\x0f\x10\x0c\x08\x1e\x12\x03\x164(\x19\x1a\x1b\x1c0+\x1f\x13\x06\x18*3"#$%-, \x14\t\x17)\x151.!2/', b'\x0c\r\x0e\x03\x04\x17\x06\x07#\t\n/$\x18\x0f\x02\x05\x08\x0b\x13\x14\x15\x162%\x194(\x1c\x10\x01\x1f !"5&\x1a3)\x1d\x11\x00+,-.\'01\x1b\x12\x1e*', b'\x0e\x1a&\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r5\'\x1b\x0f\x02\x13\x14\x15\x16\x17\x18\x194(\x1c\x10\x01\x1f !"#$%3)\x1d\x11\x00+,-./012\x12\x1e*', b'\x0f\x10\x11\x07\x04\x1a\x08\x05&\x0c\r5\'\x1b\x12\x00\x01\x02\x0e\n\x0b\x03\x16\x17\x18\x194(\x1c0+\x1f\x13\x06"#$%3)\x1d-, \x14\t./\x1512!\x1e*', b'\x11\x1d)\x07\x04\x01\x08\x05\x02\x0c\r\x0e\x0f\x103*\x1e\x12\x00\n\x0b\x03\x16\x17\x18\x19\x1a\x1b\x1c0+\x1f\x13\x06"#$%&\'(-, \x14\t./\x1512!45', b'\x12\x13\x14\x05\x04\x1d\x02\x01)\x0f\x103*\x1e\t\x06\x03\x00\x11\r\x0e"\x16\n\x07\x19\x1a\x1b\x1c0+\x1f.#\x17\x0b\x08%&\'(-, /$\x18\x0c\x1512!45', b'\x14 ,\x05\x04\x03\x02\x01\x00\x0f\x10\x11\x12\x13-!\x15\t\x06\r\x0e"\x16\n\x07\x19\x1a\x1b\x1c\x1d\x1e\x1f.#\x17\x0b\x08%&\'()*+/$\x18\x0c012345', b'!\x01\x02\x1d\x04\n\x114\x08\x00(\x0b\x0c\x07\x0e\x0f\x10,-\x1e\x12\x03\x16\x1a\x1b\x19\r\x05\x1c\x17\x18\x1f\x13\x06\x15$/+\'5%3).\x14\t #"10*2&', b'#\x07\x06\x17\x04\x03\x0b\x01\x00\x08\x10\x11\x12\x13\x14\t\n/$\x18\x0c\x15\x162%\x19\r\x05\x1c\x1d\x1e\x1f !"5&\x1a\x0e\x02()*+,-.\'01\x1b34\x0f', b'$\x01\x02\x1d\x04\n\x110\x08\x00+\x0b\x0c\x07\x0e\x0f\x10#/\x1e\x12\x03\x16\x1a\x1b\x19\r\x05\x1c\x17\x18\x1f\x13\x06\x15\'5"*3(-,2\x14\t &%1.!4)', b'&\x01\x02\x1d\x04\x05\x11\x07\x08\x00\n\x0b\x0c\r\x0e\x0f\x105\'\x1e\x12\x03\x16\x17\x18\x19\x1a\x1b\x1c4(\x1f\x13\x06+,!"#$%3) \x14\t0-\x151.*2/', b'\'\x01\x02\x1d\x04\x05\x11\x07#\x00\n/$\r\x0e\x0f\x10&5\x1e\x12\x03\x162%\x19\x1a\x1b\x1c0+\x1f\x13\x06"\x0b\x08()*\x18-, \x14\t.\x0c\x1514!\x173', b')\x01\x02\x1d\x04\x05\x11\x07\x08\x00\n\x0b\x0c\r\x0e\x0f\x103*\x1e\x12\x03\x16\x17\x18\x19\x1a\x1b\x1c0+\x1f\x13\x06"#$%&\'(-, \x14\t./\x1512!45', b'*\x01\x02\x1d\x04\x05\x11\x07\x08\x00\n\x0b\x0c\r\x0e\x0f\x10)3\x1e\x12\x03\x16\x17\x18\x19\x1a\x1b\x1c0+\x1f\x13\x06%$/(\'5"-, \x14\t2#\x1514!.&', b',\x03\x00 \x04\x01\x14\x05\x02\x06\r\x0e\x0f\x10\x11\x12\x13-!\x15\t"\x16\n\x07\x19\x1a\x1b\x1c\x1d\x1e\x1f.#\x17\x0b\x08%&\'()*+/$\x18\x0c012345', b'-\x01\x020\x04\x053\x07\x08)\n\x0b\x0c\r\x0e\x0f\x10!,+*\x1d\x16\x17\x18\x19\x1a\x1b\x1c\x15 \x1f\x1e\x11"#$%&\'(\t\x14\x13\x12\x00./\x0312\x0645', b'/\x01\x02\x1d\x04+\x11\x07\x08\x00\n\x0b\x0c0\x0e\x0f\x10$#\x1e\x12\x03\x16\x17\x18\x19\x1a\x1b\x1c(4\x1f\x13\x06"*3\r&\'%-, \x14\t.)\x151\x05!25', b'30-\x07\x04\x01\x08\x05\x02\x0c\r\x0e\x0f\x10!,+*)\n\x0b\x1d\x16\x17\x18\x19\x1a\x1b\x1c\x15 \x1f\x1e\x11"#$%&\'(\t\x14\x13\x12\x00./\x0312\x0645', b'543\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r*)(\'&\x13\x14\x15\x16\x17\x18\x19\x1e\x1d\x1c\x1b\x1a\x1f !"#$%\x12\x11\x10\x0f\x0e+,-./012\x02\x01\x00'),
+    (b'\x00\x01/\x03\x042\x02.-\x0f"!,%$#\x10\x11\x12\x13\x0e\x1b\x16\x15 \x19\x18\x17\x1c\x1d\x1e\x1f\x1a\'\n\t\x14\r\x0c\x0b()*+&5\x07\x0601\x0534\x08', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'()*+,-./012345', b'\x00\x01\x02\x03\x04\x05\x08\n$\x0c\x07#/\r\x0e\x0f\x10\x11\x12\x13\x0b4\x16".\x19\x1a\x1b\x1c\x1d\x1e\x1f(\t\x15!-%\'5\x17)*+\x06\x14 ,0123\x18&', b'\x00\x01\x02\x03\x04\x05\t.-\x14"!,\r\x0e\x0f\x10\x11\x12\x13\x06+\x16\x15 \x19\x1a\x1b\x1c\x1d\x1e\x1f0/45&\x07*3\x17\x0b\x08%$#(\'21\n\x0c\x18)', b'\x00\x01\x02\x03\x04\x05\x0b \x14\x08\x15\t\x06\r\x0e\x0f\x10\x11\x12\x13\x0c+\x16\n\x07\x19\x1a\x1b\x1c\x1d\x1e\x1f0,45&\x18*3"#$%-!(\'21\x17/.)', b'\x00\x01\x02\x03\x04\x05\x0c\x18$\x0b\x17#/\r\x0e\x0f\x10\x11\x12\x13\x08\n\x16".\x19\x1a\x1b\x1c\x1d\x1e\x1f\x07\t\x15!-%&\'()*+\x06\x14 ,012345', b'\x00\x01\x0b\x03\x04\n\x0e -\x02\x15!,\x07\x0c\x08\x10\x11\x12\x13\x0f\r\x16\x1a\x1b\x19\x18\x17\x1c\x1d\x1e\x1f\x05/+\t\x14"*3(&\'%$#0\x0621.54)', b'\x00\x01/\x03\x042\x0f\x1b-\x0e\x1a!,%$#\x10\x11\x12\x13\x024\x16\x15 \x19\x18\x17\x1c\x1d\x1e\x1f(5\n\t\x14\r\x0c\x0b"*3+\'&\x07\x0601\x05).\x08', b'\x00\x01\x02\x03\x04\x05\x14\x15\x08\x06 \x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\t4\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f(!"#$%\'5\n)*+,-./0123\x07&', b'\x00\x01\x02\x03\x04\x05!\x173-\x18*)\r\x0e\x0f\x10\x11\x12\x13,2\x16\x15 \x19\x1a\x1b\x1c\x1d\x1e\x1f%\x0b\n\t\x14"$/+&\'(\x0c\x08\x07\x0641.50#', b'\x00\x01\x02\x03\x04\x05#2-$%!,\r\x0e\x0f\x10\x11\x12\x13/\x17\x16\x15 \x19\x1a\x1b\x1c\x1d\x1e\x1f\x18\x0b\n\t\x14(\'5"*3+\x0c\x08\x07\x06014).&', b'\x00\x01\x02\x03\x04\x05$\x17-/\x18!,\r\x0e\x0f\x10\x11\x12\x13#4\x16\x15 \x19\x1a\x1b\x1c\x1d\x1e\x1f(\x0b\n\t\x14%\'5")*+\x0c\x08\x07\x060123.&', b'\x00\x01\x02\x03\x04\n& -\'\x15!,\x07\x0e\x0f\x10\x11\x12\x135\x1a\x16%2\x19\r\x05\x1c\x1d\x1e\x1f\x1b\x0b+\t\x14"*3($/\x18\x0c\x080\x06\x171.#4)', b'\x00\x01\x0b\x03\x04\x17\'.-5"!,\x18\x0c\x08\x10\x11\x12\x13&2\x16\x15 \x19\r\x05\x1c\x1d\x1e\x1f%/\n\t\x14\x1a\x0e\x02()*+$#\x07\x0601\x1b34\x0f', b'\x00\x01\x02\x03\x04\x05) \x14*\x15\t\x06\r\x0e\x0f\x10\x11\x12\x133+\x16\n\x07\x19\x1a\x1b\x1c\x1d\x1e\x1f0,\x17\x0b\x08"#$%&\'(-!\x18\x0c41.52/', b'\x00\x01\x02\x03\x04\x05* \x143\x15\t\x06\r\x0e\x0f\x10\x11\x12\x13)+\x16\n\x07\x19\x1a\x1b\x1c\x1d\x1e\x1f0,\x17\x0b\x08%$/(\'5"-!\x18\x0c.12&4#', b'\x00\x01\x02\x03\x04\x05, \x14!\x15\t\x06\r\x0e\x0f\x10\x11\x12\x13-"\x16\n\x07\x19\x1a\x1b\x1c\x1d\x1e\x1f.#\x17\x0b\x08%&\'()*+/$\x18\x0c012345', b'\x00\x01\x02\x03\x04\x05-03,+*)\r\x0e\x0f\x10\x11\x12\x13!\x17\x16\x15 \x19\x1a\x1b\x1c\x1d\x1e\x1f\x18\x0b\n\t\x14"#$%&\'(\x0c\x08\x07\x0641.52/', b'\x00\x01\x02\x03\x04\x05/.-#"!,\r\x0e\x0f\x10\x11\x12\x13$\x17\x16\x15 \x19\x1a\x1b\x1c\x1d\x1e\x1f\x18\x0b\n\t\x14%&\'()*+\x0c\x08\x07\x06012345', b'\x00\x01\x0b\x03\x04\x1a3 -)\x15!,\x1b\x0c\x08\x10\x11\x12\x13*.\x16%2\x19\x07\n\x1c\x1d\x1e\x1f"&+\t\x14\r\x0e\x02($/\x185\'0\x06\x171\x05#4\x0f', b'\x00\x01\x0b\x03\x04\x1752-&%!,\x18\x0c\x08\x10\x11\x12\x13\'4\x16\x15 \x19\r\x05\x1c\x1d\x1e\x1f(#\n\t\x14\x1a\x0e\x02"*3+/$\x07\x0601\x1b).\x0f'),
+    (b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'()*+,-./012345', b'\x00\x01\x08\x03\x044\x06\x07)\t\n3*(\x0b\x0c\x10\x11\x12\x13\x14\x15\x16\x1b\x1a\x19\x18\x17\x1c\x1d\x1e\x1f !%\x0f\x0e\r$/"\'5+,-2\x0201\x05&.#', b'\x00\x01\x0b\x03\x04\x17\x06\x07#\t\n/$\x18\x0c\x08\x10\x11\x12\x13\x14\x15\x162%\x19\r\x05\x1c\x1d\x1e\x1f !"5&\x1a\x0e\x02()*+,-.\'01\x1b34\x0f', b'\x00\x01\x0c\x03\x044\x06\x073\t\n*)(\x08\x0b\x10\x11\x12\x13\x14\x15\x16\x1b\x1a\x19%2\x1c\x1d\x1e\x1f !"\x0f\x0e\r$/\x18\'5+,-.\x0201\x05&\x17#', b'\x00\x01\x0e\x03\x04.\x060)\t+3*"\x0f\x02\x10\x11\x12\x13\x14\x1a\x16\x17\x18\x19\x05\r\x1c\x1d\x1e\x1f\x1b!\x15\x08\x0c\x07$/(&\'%,- \x0b21\n54#', b'\x00\x01\x0f\x03\x044\x06\x07*\t\n)3(\x02\x0e\x10\x11\x12\x13\x14\x15\x16."\x19\x18\x17\x1c\x1d\x1e\x1f !%\'5\r\x0c\x0b\x1a/#+,-2&01\x05$\x1b\x08', b'\x00\x01!\x03\x04.\x06\x07#\t\n/$",-\x10\x11\x12\x13\x14\x15\x16\x1b\x1a\x19%2\x1c\x1d\x1e\x1f *\x18\x0f\x0e\r\x0c\x0b+&\'()3\x17\x0241\x0550\x08', b'\x00\x01#\x03\x044\x06\x07&\t\n5\'(/$\x10\x11\x12\x13\x14\x15\x16\x1b\x1a\x19\x18\x17\x1c\x1d\x1e\x1f !%\x0f\x0e\r\x0c\x0b"*3+,-2\x0201\x05).\x08', b'\x00\x01$\x03\x042\x06\x07&\t\n5\'%#/\x10\x11\x12\x13\x14\x15\x16\x1b\x1a\x19(4\x1c\x1d\x1e\x1f !\x18\x0f\x0e\r\x0c\x0b")*+,-\x17\x0201\x053.\x08', b'\x00\x01&\x03\x04.\x060)\t+3*"5\'\x10\x11\x12\x13\x14%\x16\x05\r\x19\x1b\x1a\x1c\x1d\x1e\x1f2!\x15\x0f\x0e\x07\x0c\x0b($/\x18,- \x02\x171\n#4\x08', b'\x00\x01\'\x03\x04\x1b\x06\x07\x0f\t\n\x02\x0e\x1a&5\x10\x11\x12\x13\x14\x15\x16\x05\r\x19%2\x1c\x1d\x1e\x1f !"\x08\x0c\x18$/()*+,-.\x0b01\x1734#', b'\x00\x01)\x03\x04.\x06\x07/\t\n$#"3*\x10\x11\x12\x13\x14\x15\x16\x1b\x1a\x19(4\x1c\x1d\x1e\x1f !\x18\x0f\x0e\r\'5%\x0b\x08+,-\x17\x0201\x05\x0c2&', b'\x00\x01*\x03\x04.\x06\x07\'\t\n&5")3\x10\x11\x12\x13\x14\x15\x16(4\x192%\x1c\x1d\x1e\x1f !+#$\r\x0e\x02\x18\x0b\x08\x1a,-0/\x1b1\x05\x0c\x17\x0f', b'\x00\x01,\x03\x042\x06\x07#\t\n/$%-!\x10\x11\x12\x13\x14\x15\x16\x1b\x1a\x19\x18\x17\x1c\x1d\x1e\x1f *"\x0f\x0e\r\x0c\x0b+\'5()3.\x0241\x05&0\x08', b'\x00\x01-\x03\x04.\x06\x07/\t\n$#"!,\x10\x11\x12\x13\x14\x15\x16\x1b\x1a\x19\x18\x17\x1c\x1d\x1e\x1f *+\x0f\x0e\r\x0c\x0b%&\'()30\x0241\x0552\x08', b'\x00\x01/\x03\x042\x06\x075\t\n\'&%$#\x10\x11\x12\x13\x14\x15\x16\x1b\x1a\x19\x18\x17\x1c\x1d\x1e\x1f !"\x0f\x0e\r\x0c\x0b()*+,-.\x0201\x0534\x08', b'\x00\x013\x03\x04\x17\x06\x075\t\n\'&\x18*)\x10\x11\x12\x13\x14\x15\x16."\x19\r\x05\x1c\x1d\x1e\x1f !%\x0c\x0b\x1a\x0e\x02(/#+,-2\x0801\x1b$4\x0f', b'\x00\x015\x03\x044\x06\x07*\t\n)3(\'&\x10\x11\x12\x13\x14\x15\x16."\x19\r\x05\x1c\x1d\x1e\x1f !\x18/#\x1a\x0e\x02%\x0b\x08+,-\x17$01\x1b\x0c2\x0f'),
+    (b'\x00\x01\x02\x03\x04\x05\x06\x07&\t\n5\'\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x164(\x19\x1a\x1b\x1c\x1d\x1e\x1f \x08+,!\x18*3"#$%\x0b\x0c0-21\x17/.)', b'\x00\x01\x02\x03\x04+\x06\x07#\t\n/$0\x0e\x0f\x10\x11\x12\x13\x14\x15\x162%\x19\x1a\x1b\x1c\x1d\x1e\x1f \x0b\x17,!"5&\r)*(\x0c\x08\x18-41.3\x05\'', b'\x00\x01\x02\x03\x04\x05\x06\x07&\t\n5\'\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x164(\x19\x1a\x1b\x1c\x1d\x1e\x1f \x0c+,!"3)%$/\x18\x08\x0b0-\x171.#2*', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'()*+,-./012345', b'\x00\x01\x02\x03\x04+\x06\x07\x08\t\n\x0b\x0c0\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f #4,!"*3\r&\'%/$(-21.5\x05)', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f $%&\'()*+,!"#/25.14-03', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f &(*3+,!"#$%5\'4)210/.-', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f \'()*+,!"#$%&543210/.-', b'\x00\x01\x02\x03\x04%\x06\x07\x08\t\n\x0b\x0c2\x0e\x0f\x10\x11\x12\x13\x14\x15\x160+\x19\r\x05\x1c\x1d\x1e\x1f )"&\'\x1a,!4$/\x183*.5\x171\x1b#(-', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f *+,!"#$%&\'()30-41.52/', b'\x00\x01\x02\x03\x04(\x06\x07\x08\t\n\x0b\x0c4\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f ,2)*+\'5\r#$"-!%3.10/\x05&', b'\x00\x01\x02\x03\x04\n\x064\x08\t(\x0b\x0c\x07\x0e\x0f\x10\x11\x12\x13\x14"\x16\x1a\x1b\x19\r\x05\x1c\x1d\x1e\x1f.-\x18)*\x15$/+\'5%!,\x17321 &0#', b'\x00\x01\x02\x03\x04\n\x060\x08\t+\x0b\x0c\x07\x0e\x0f\x10\x11\x12\x13\x14%\x16\x1a\x1b\x19\r\x05\x1c\x1d\x1e\x1f2/\x18,!\x15\'5"*3($#\x17-41 ).&', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f 3+,!%$/(\'5"*)0-.12&4#', b'\x00\x01\x02\x03\x04\x05\x06\x07#\t\n/$\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x162%\x19\x1a\x1b\x1c\x1d\x1e\x1f 5+,!"\x0b\x08()*\x18\'&0-\x171.34\x0c'),
+    (b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'()*+,-./012345', b'\x00\x01\x02\x03\x04\x05\x06\x07\x0b\t\n\x0c\x08\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x164(\x19\x1a\x1b\x1c\x1d\x1e\x1f !"/#\x18\'5%*3+,-.$01\x17)2&', b'\x00\x01\x02\x03\x04\x05\x06\x07\x0c\t\n\x08\x0b\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x164(\x19\x1a\x1b\x1c\x1d\x1e\x1f !%/#"\'5\x183)+,-2$01.*\x17&', b'\x00\x01\x02\x03\x04\x05\x06\x07#\t\n/$\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x162%\x19\x1a\x1b\x1c\x1d\x1e\x1f !"\x0b\x08()*\x18\'5+,-.\x0c014&\x173', b'\x00\x01\x02\x03\x04\x05\x06\x07$\t\n#/\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x164(\x19\x1a\x1b\x1c\x1d\x1e\x1f !%\x0b\x08"*3\x185&+,-2\x0c01.\'\x17)', b'\x00\x01\x02\x03\x04\x05\x06\x07&\t\n5\'\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x164(\x19\x1a\x1b\x1c\x1d\x1e\x1f !\x18*3"#$%\x0b\x08+,-\x17)01.\x0c2/', b'\x00\x01\x02\x03\x04\n\x060\'\t+&5\x07\x0e\x0f\x10\x11\x12\x13\x14%\x16."\x19\r\x05\x1c\x1d\x1e\x1f2!\x15\x0b\x08($/\x1b3)\x18,- \x0c\x1714*\x1a#', b'\x00\x01\x02\x03\x04\x05\x06\x07)\t\n3*\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !%5&"\x0b\x08(/#+,-2\'01.$4\x0c', b'\x00\x01\x02\x03\x04\x05\x06\x07*\t\n)3\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16."\x19\x1a\x1b\x1c\x1d\x1e\x1f !\x185&%\x0b\x08($/+,-\x17\'012#4\x0c', b'\x00\x01\x02\x03\x04\x05\x06\x07/\t\n$#\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x162%\x19\x1a\x1b\x1c\x1d\x1e\x1f !\x18\x0b\x08")*(5&+,-\x17\x0c01.\'43', b'\x00\x01\x02\x03\x04%\x06\x073\t\n*)2\x0e\x0f\x10\x11\x12\x13\x14\x15\x16."\x19\r\x05\x1c\x1d\x1e\x1f !+\'54$/\x18\x0b\x08\x1a,-0&\x1b1(\x0c\x17#', b'\x00\x01\x02\x03\x04\x1b\x06\r5\t\x05\'&\x1a\x0e\x0f\x10\x11\x12\x13\x14\x15\x162%\x19+0\x1c\x1d\x1e\x1f !"\x0b\x08\x18)*\x07/#(,-.\x0c41\x17$\n3'),
+    (b'\x00\x15\x02\x03\x04\x05\x060\x08\t+\x0b\x0c\r\x0e\x0f \x11\x12\x13\x14(\x16\x17\x18\x19\x1a\x1b\x1c\x07\n\x1f4!\x01/#"5&%3)\x1e,-\x10$\x1d1.*2\'', b'\x00\x10\x02\x1d\x04\n\x060\x08\t+\x0b\x0c\x07\x0e\x0f\x01\x11\x12\x1e\x14%\x16\x1a\x1b\x19\r\x05\x1c \x15\x1f2!\x03\'5"*3($/\x18,-\x13&\x171.#4)', b'\x00\x01\x02\x03\x042\x06\x07\x08\t\n\x0b\x0c%\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !\x05$/0\'5"*3(,-\r#41+).&', b'\x00\x01\x02\x03\x04\x1b\x06\r\x08\t\x05\x0b\x0c\x1a\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19+0\x1c\x1d\x1e\x1f !\x07\'5%/#")*(,-\n&4123.$', b'\x00\x01\x02\x03\x04%\x060\x08\t+\x0b\x0c2\x0e\x0f\x10\x11\x12\x13\x14\x15\x16(4\x19\r\x05\x1c\x1d\x1e\x1f !\n$/\x183)"&\'\x1a,-\x07#\x1b1\x175.*', b'\x00\x01\x02\x03\x04+\x06\x07\x08\t\n\x0b\x0c0\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !\r3)%\'5"#$4,-\x05*(12/.&', b'\x00\x15\x02\x03\x04%\x060\x08\t+\x0b\x0c2\x0e\x0f \x11\x12\x13\x14(\x16\x1d\x1e\x19\r\x05\x1c\x07\n\x1f4!\x10$/\x183)"&\'\x1a,-\x01#\x1b1\x175.*', b'\x00\x10\x02\x1d\x04%\x064\x08\t(\x0b\x0c2\x0e\x0f\x01\x11\x12\x1e\x14\n\x160+\x19\r\x05\x1c \x15\x1f\x07!\x13$/\x183)"&\'\x1a,-\x03#\x1b1\x175.*', b'\x00\x01\x02\x03\x04\n\x060\x08\t+\x0b\x0c\x07\x0e\x0f\x10\x11\x12\x13\x14%\x16\x1a\x1b\x19\r\x05\x1c\x1d\x1e\x1f2!\x15\'5"*3($/\x18,- &\x171.#4)', b'\x00\x01\x02\x03\x04(\x06\x07\x08\t\n\x0b\x0c4\x0e\x0f\x10\x11\x12\x13\x14\x15\x160+\x19\r\x05\x1c\x1d\x1e\x1f !\x17#$%3)"\'5\x1a,-\x18/\x1b12&.*', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x164(\x19\x1a\x1b\x1c\x1d\x1e\x1f !\x18/#%\'5")*+,-\x17$0123.&', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19%2\x1c\x1d\x1e\x1f !\x1a$/+\'5"*3(,-\x1b#410).&', b'\x00\x01\x02\x03\x04\n\x060\x08\t+\x0b\x0c\x07\x0e\x0f\x10\x11\x12\x13\x14%\x164(\x19\r\x05\x1c\x1d\x1e\x1f2!\x1b&\'"3)\x15$/\x18,-\x1a5\x171.# *', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c0+\x1f !\x1d/#"5&%3)4,-\x1e$(1.*2\'', b'\x00\x01\x02\x03\x04%\x06\x07\x08\t\n\x0b\x0c2\x0e\x0f\x10\x11\x12\x13\x14\x15\x16(4\x19\r\x05\x1c0+\x1f !\x1e$/\x183)"&\'\x1a,-\x1d#\x1b1\x175.*', b'\x00\x01\x02\x03\x04%\x064\x08\t(\x0b\x0c2\x0e\x0f\x10\x11\x12\x13\x14\n\x160+\x19\r\x05\x1c\x1d\x1e\x1f\x07! $/\x183)"&\'\x1a,-\x15#\x1b1\x175.*', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'()*+,-./012345', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !%$/(\'5"*3+,-2#014).&', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !(/#"5&%3)+,-4$01.*2\'', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !+$/%\'5"*3(,-0#412).&', b'\x00\x01\x02\x03\x04(\x06\x07\x08\t\n\x0b\x0c4\x0e\x0f\x10\x11\x12\x13\x14\x15\x160+\x19\r\x05\x1c\x1d\x1e\x1f !./#\x18)*%\'5\x1a,-"$\x1b1\x17&23', b'\x00\x01\x02\x03\x04(\x06\x07\x08\t\n\x0b\x0c4\x0e\x0f\x10\x11\x12\x13\x14\x15\x162%\x19\r\x05\x1c\x1d\x1e\x1f !0#$\x18)*"&\'\x1a,-+/\x1b1\x175.3', b'\x00\x01\x02\x03\x04+\x06\x07\x08\t\n\x0b\x0c0\x0e\x0f\x10\x11\x12\x13\x14\x15\x164(\x19\r\x05\x1c\x1d\x1e\x1f !2$/\x183)"&\'\x1a,-%#\x1b1\x175.*', b'\x00\x01\x02\x03\x04%\x06\x07\x08\t\n\x0b\x0c2\x0e\x0f\x10\x11\x12\x13\x14\x15\x160+\x19\r\x05\x1c\x1d\x1e\x1f !4$/\x183)"&\'\x1a,-(#\x1b1\x175.*'),
+    (b'\x00\x1e\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x1d\x11\x12\x13\x14\x15\x16\x01\x10\x19\x1a\x1b\x1c+0\x1f !"/#%\'5\x18)*(,-.$4123\x17&', b'\x00\x10\x020\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x01\x11\x12+\x14\x15\x16\x03\x13\x19\x1a\x1b\x1c\x1d\x1e\x1f !"$/\x185&%)*4,-.#(1\x1732\'', b'\x00\x01\x02\x03\x04+\x06\x07\x08\t\n\x0b\x0c0\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x05\r\x19\x1a\x1b\x1c\x1d\x1e\x1f !")*%\'5\x18/#4,-.3(12$\x17&', b'\x00\x01\x02\x03\x04\x1b\x06\r\x08\t\x05\x0b\x0c\x1a\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x07\n\x190+\x1c\x1d\x1e\x1f !"5&%$/\x18)*(,-.\'4123\x17#', b'\x00\x01\x02\x03\x04\x1b\x06\r\x08\t\x05\x0b\x0c\x1a\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\n\x07\x19+0\x1c\x1d\x1e\x1f !"5&%$/\x18)*(,-.\'4123\x17#', b'\x00\x01\x02\x03\x042\x06\x07\x08\t\n\x0b\x0c%\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\r\x05\x19\x1a\x1b\x1c\x1d\x1e\x1f !"/#0\'5\x18)*(,-.$41+3\x17&', b'\x00\x15\x02\x03\x04\x05\x060\x08\t+\x0b\x0c\r\x0e\x0f \x11\x12\x13\x14(\x16\x10\x01\x19\x1a\x1b\x1c\x07\n\x1f4!"$/\x185&%)*\x1e,-.#\x1d1\x1732\'', b'\x00\x10\x02\x1d\x04\x05\x064\x08\t(\x0b\x0c\r\x0e\x0f\x01\x11\x12\x1e\x14\n\x16\x13\x03\x19\x1a\x1b\x1c \x15\x1f\x07!"$/\x185&%)*+,-.#01\x1732\'', b'\x00\x01\x02\x03\x04\x05\x06+\x08\t0\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\n\x16\x15 \x19\x1a\x1b\x1c\x1d\x1e\x1f\x07!"/#%\'5\x18)*(,-.$4123\x17&', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'()*+,-./012345', b'\x00\x01\x02\x03\x04\x1b\x06\r\x08\t\x05\x0b\x0c\x1a\x0e\x0f\x10\x11\x12\x13\x14\n\x16\x18\x17\x19+0\x1c\x1d\x1e\x1f\x07!"&\'(#$%)*\x15,-.5 1432/', b'\x00\x01\x02\x03\x042\x06\r\x08\t\x05\x0b\x0c%\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x1a\x1b\x19+0\x1c\x1d\x1e\x1f !"\'54/#\x07)*\x18,-.&\x171(3\n$', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x1b\x1a\x19%2\x1c\x1d\x1e\x1f !"/#+\'5\x18)*(,-.$4103\x17&', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14+\x16\x1d\x1e\x19\x1a\x1b\x1c \x15\x1f0!"/#%\'5\x18)*(,-.$4123\x17&', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x1e\x1d\x19\x1a\x1b\x1c0+\x1f !"$/\x185&%)*4,-.#(1\x1732\'', b'\x00\x01\x02\x03\x04\x05\x064\x08\t(\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\n\x16 \x15\x19\x1a\x1b\x1c\x1d\x1e\x1f\x07!"$/\x185&%)*+,-.#01\x1732\'', b'\x00\x01\x02\x03\x04+\x06\x07\x08\t\n\x0b\x0c0\x0e\x0f\x10\x11\x12\x13\x14\x15\x16%2\x19\r\x05\x1c\x1d\x1e\x1f !"$/\x18*3(\'5\x1a,-.#\x1b1\x17&4)', b'\x00\x01\x02\x03\x04\x1b\x06\r\x08\t\x05\x0b\x0c\x1a\x0e\x0f\x10\x11\x12\x13\x14\n\x16(4\x19+0\x1c\x1d\x1e\x1f\x07!"5&%$/\x18)*\x15,-.\' 123\x17#', b'\x00\x01\x02\x03\x04\x1b\x06\r\x08\t\x05\x0b\x0c\x1a\x0e\x0f\x10\x11\x12\x13\x14\x15\x16+0\x194(\x1c\x1d\x1e\x1f !"5&%$/\x18)*\x07,-.\'\n123\x17#', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x160+\x19\x1a\x1b\x1c\x1d\x1e\x1f !"/#%\'5\x18)*(,-.$4123\x17&', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x162%\x19\x1a\x1b\x1c\x1d\x1e\x1f !"/#(\'5\x18)*+,-.$0143\x17&', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x164(\x19\x1a\x1b\x1c\x1d\x1e\x1f !"$/\x185&%)*+,-.#01\x1732\''),
+    (b'\x00\x01\x02\x03\x044\x06\x07\x08\t\n\x0b\x0c(\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x190+\x1c\x1d\x1e\x1f !"*3%#$\x055&\x1a,-.)\x1b12\'\r/', b'\x00\x01\x02\x03\x044\x06\x07\x08\t\n\x0b\x0c(\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x190+\x1c\x1d\x1e\x1f !"*3%$/\x05\'5\x1a,-.)\x1b12&\r#', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'()*+,-./012345', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%\'5(3)+,-./012*4&', b'\x00\x01\x02\x03\x04+\x06\x07\x08\t\n\x0b\x0c0\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\r\x05\x1c\x1d\x1e\x1f !"#$()*2&\'\x1a,-./\x1b145%3', b'\x00\x01\x02\x03\x04+\x06\x07\x08\t\n\x0b\x0c0\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\r\x05\x1c\x1d\x1e\x1f !"#$(*325&\x1a,-./\x1b14\'%)', b'\x00\x01\x02\x03\x044\x06\x07\x08\t\n\x0b\x0c(\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x190+\x1c\x1d\x1e\x1f !"*3%/#\x05&\'\x1a,-.)\x1b125\r$', b'\x00\x01\x02\x03\x04+\x06\x07\x08\t\n\x0b\x0c0\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\r\x05\x1c\x1d\x1e\x1f !"#$(3)2\'5\x1a,-./\x1b14&%*', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%5&(*3+,-./012)4\''),
+    (b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'()*+,-./012345', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"$/+&\'%3)(,-.#410*25', b'\x00\x01\x02\x03\x04+\x06\x07\x08\t\n\x0b\x0c0\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !")*%&\'4#$\r,-.3\x0512/(5', b'\x00\x01\x02\x03\x04+\x06\x07\x08\t\n\x0b\x0c0\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"*3\r&\'%/#4,-.)(1\x05$25', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"/#(&\'+*3%,-.$214)05', b'\x00\x01\x02\x03\x04%\x06\x07\x08\t\n\x0b\x0c2\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"3)\r&\'($/0,-.*+1\x05#45'),
+    (b'\x00\x03\x02+\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x13\x11\x120\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$\x01&\'%)*(,-./41\x10325', b'\x00\x10\x020\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x01\x11\x12+\x14\x1e\x16\x17\x18\x19\x1a\x1b\x1c \x15\x1f\x1d!"#$\x03&\'%)*(,-./41\x13325', b'\x00\x01\x02\x03\x042\x06\x07\x08\t\n\x0b\x0c%\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$\x05&\'0)*(,-./41\r3+5', b'\x00\x01\x02\x03\x04\x05\x060\x08\t+\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$\x07&\'4)*%,-./21\n3(5', b'\x00\x01\x02\x03\x04\x05\x06(\x08\t4\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$\n&\'%)*0,-./+1\x07325', b'\x00\x01\x02\x03\x044\x06\x07\x08\t\n\x0b\x0c(\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$\r&\'%)*+,-./01\x05325', b'\x00\x1e\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x1d\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c+0\x1f !"#$\x10&\'%)*(,-./41\x01325', b'\x00\x10\x02\x1d\x04\x05\x06+\x08\t0\x0b\x0c\r\x0e\x0f\x01\x11\x12\x1e\x14\n\x16\x17\x18\x19\x1a\x1b\x1c \x15\x1f\x07!"#$\x13&\'%)*(,-./41\x03325', b'\x00\x01\x02\x03\x04\x05\x064\x08\t(\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\n\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f\x07!"#$\x15&\'+)*%,-./21 305', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19%2\x1c\x1d\x1e\x1f !"#$\x1a&\'+)*(,-./41\x1b305', b'\x00\x01\x02\x03\x04\x05\x064\x08\t(\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19+0\x1c\x1d\x1e\x1f !"#$\x1b&\'%)*\x07,-./\n1\x1a325', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c0+\x1f !"#$\x1d&\'4)*%,-./21\x1e3(5', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14+\x16\x17\x18\x19\x1a\x1b\x1c \x15\x1f0!"#$\x1e&\'%)*(,-./41\x1d325', b'\x00\x01\x02\x03\x04\x05\x06+\x08\t0\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\n\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f\x07!"#$ &\'%)*(,-./41\x15325', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'()*+,-./012345', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$(&\'+)*%,-./214305', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$+&\'%)*(,-./410325', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$0&\'%)*4,-./(1+325', b'\x00\x01\x02\x03\x04\r\x06\x07\x08\t\n\x0b\x0c\x05\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$2&\'4)*0,-./+1%3(5', b'\x00\x01\x02\x03\x04\x05\x060\x08\t+\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$4&\'%)*\x07,-./\n1(325'),
+    (b'\x00\x03\x02+\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x13\x11\x120\x14\x15\x16\x17\x18\x19\x01\x10\x1c\x1d\x1e\x1f !"#$%&\'\x1a)*(,-./4123\x1b5', b'\x00\x10\x020\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x01\x11\x12+\x14\x1e\x16\x17\x18\x19\x03\x13\x1c \x15\x1f\x1d!"#$%&\'\x1a)*(,-./4123\x1b5', b'\x00\x01\x02\x03\x044\x06\x07\x08\t\n\x0b\x0c(\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x05\r\x1c\x1d\x1e\x1f !"#$%&\'\x1a)*0,-./+123\x1b5', b'\x00\x01\x02\x03\x04\x05\x060\x08\t+\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x07\n\x1c\x1d\x1e\x1f !"#$%&\'4)*\x1a,-./\x1b123(5', b'\x00\x01\x02\x03\x04\x05\x06(\x08\t4\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\n\x07\x1c\x1d\x1e\x1f !"#$%&\'\x1a)*0,-./+123\x1b5', b'\x00\x01\x02\x03\x044\x06\x07\x08\t\n\x0b\x0c(\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\r\x05\x1c\x1d\x1e\x1f !"#$%&\'\x1a)*+,-./0123\x1b5', b'\x00\x1e\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x1d\x11\x12\x13\x14\x15\x16\x17\x18\x19\x10\x01\x1c+0\x1f !"#$%&\'\x1a)*(,-./4123\x1b5', b'\x00\x10\x02\x1d\x04\x05\x06+\x08\t0\x0b\x0c\r\x0e\x0f\x01\x11\x12\x1e\x14\n\x16\x17\x18\x19\x13\x03\x1c \x15\x1f\x07!"#$%&\'\x1a)*(,-./4123\x1b5', b'\x00\x01\x02\x03\x04\x05\x064\x08\t(\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\n\x16\x17\x18\x19\x15 \x1c\x1d\x1e\x1f\x07!"#$%&\'+)*\x1a,-./\x1b12305', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'()*+,-./012345', b'\x00\x01\x02\x03\x04\x05\x064\x08\t(\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1b\x1a\x1c\x1d\x1e\x1f !"#$%&\'+)*\x07,-./\n12305', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1d\x1e\x1c0+\x1f !"#$%&\'4)*\x1a,-./\x1b123(5', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14+\x16\x17\x18\x19\x1e\x1d\x1c \x15\x1f0!"#$%&\'\x1a)*(,-./4123\x1b5', b'\x00\x01\x02\x03\x04\x05\x06+\x08\t0\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\n\x16\x17\x18\x19 \x15\x1c\x1d\x1e\x1f\x07!"#$%&\'\x1a)*(,-./4123\x1b5', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19(4\x1c\x1d\x1e\x1f !"#$%&\'+)*\x1a,-./\x1b12305', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19+0\x1c\x1d\x1e\x1f !"#$%&\'\x1a)*(,-./4123\x1b5', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x190+\x1c\x1d\x1e\x1f !"#$%&\'\x1a)*4,-./(123\x1b5', b'\x00\x01\x02\x03\x04\x05\x060\x08\t+\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x194(\x1c\x1d\x1e\x1f !"#$%&\'\x1a)*\x07,-./\n123\x1b5'),
+    (b'\x00\x1e\x02\x03\x04\x01\x06\x07\x08\t\n\x0b\x0c\x10\x0e\x0f\x1d\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c+0\x1f !"#$%&\'\r)*(,-./4123\x055', b'\x00\x10\x020\x04\x03\x06\x07\x08\t\n\x0b\x0c\x13\x0e\x0f\x01\x11\x12+\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'4)*\r,-./\x05123(5', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'()*+,-./012345', b'\x00\x01\x02\x03\x04\x07\x060\x08\t+\x0b\x0c\n\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'()*\r,-./\x0512345', b'\x00\x01\x02\x03\x04\n\x060\x08\t+\x0b\x0c\x07\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'4)*\r,-./\x05123(5', b'\x00\x01\x02\x03\x04\r\x06\x07\x08\t\n\x0b\x0c\x05\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'()*0,-./+12345', b'\x00\x15\x02\x03\x04\x10\x060\x08\t+\x0b\x0c\x01\x0e\x0f \x11\x12\x13\x14(\x16\x17\x18\x19\x1a\x1b\x1c\x07\n\x1f4!"#$%&\'\x1e)*\r,-./\x05123\x1d5', b'\x00\x10\x02\x1d\x04\x13\x064\x08\t(\x0b\x0c\x03\x0e\x0f\x01\x11\x12\x1e\x14\n\x16\x17\x18\x19\x1a\x1b\x1c \x15\x1f\x07!"#$%&\'+)*\r,-./\x0512305', b'\x00\x01\x02\x03\x04\x15\x06+\x08\t0\x0b\x0c \x0e\x0f\x10\x11\x12\x13\x14\n\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f\x07!"#$%&\'\r)*(,-./4123\x055', b'\x00\x01\x02\x03\x04\x1d\x06\x07\x08\t\n\x0b\x0c\x1e\x0e\x0f\x10\x11\x12\x13\x14+\x16\x17\x18\x19\x1a\x1b\x1c \x15\x1f0!"#$%&\'\r)*(,-./4123\x055', b'\x00\x01\x02\x03\x04\x1e\x06\x07\x08\t\n\x0b\x0c\x1d\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c0+\x1f !"#$%&\'4)*\r,-./\x05123(5', b'\x00\x01\x02\x03\x04 \x064\x08\t(\x0b\x0c\x15\x0e\x0f\x10\x11\x12\x13\x14\n\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f\x07!"#$%&\'+)*\r,-./\x0512305', b'\x00\x01\x02\x03\x04(\x06\x07\x08\t\n\x0b\x0c4\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'0)*\r,-./\x05123+5', b'\x00\x01\x02\x03\x04+\x06\x07\x08\t\n\x0b\x0c0\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'\r)*4,-./(123\x055', b'\x00\x01\x02\x03\x040\x06\x07\x08\t\n\x0b\x0c+\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'\r)*(,-./4123\x055', b'\x00\x01\x02\x03\x044\x06\x07\x08\t\n\x0b\x0c(\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'+)*\r,-./\x0512305'),
+    (b'\x00\x15\x02\x03\x04\x05\x060\x08\t+\x0b\x0c\r\x0e\x0f \x11\x12\x13\x14(\x16\x17\x18\x19\x1a\x1b\x1c\x07\n\x1f4!"#$%&\'\x01)*\x1e,-./\x1d123\x105', b'\x00\x10\x02\x1d\x04\x05\x064\x08\t(\x0b\x0c\r\x0e\x0f\x01\x11\x12\x1e\x14\n\x16\x17\x18\x19\x1a\x1b\x1c \x15\x1f\x07!"#$%&\'\x03)*+,-./0123\x135', b'\x00\x01\x02\x03\x04\x05\x060\x08\t+\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'\x07)*4,-./(123\n5', b'\x00\x01\x02\x03\x04\x05\x060\x08\t+\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'\n)*(,-./4123\x075', b'\x00\x15\x02\x03\x04\x05\x060\x08\t+\x0b\x0c\r\x0e\x0f \x11\x12\x13\x14(\x16\x17\x18\x19\x1a\x1b\x1c\x07\n\x1f4!"#$%&\'\x10)*\x1d,-./\x1e123\x015', b'\x00\x10\x020\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x01\x11\x12+\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'\x13)*4,-./(123\x035', b'\x00\x01\x02\x03\x04\x05\x064\x08\t(\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\n\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f\x07!"#$%&\'\x15)*+,-./0123 5', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c0+\x1f !"#$%&\'\x1d)*4,-./(123\x1e5', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c0+\x1f !"#$%&\'\x1e)*(,-./4123\x1d5', b'\x00\x01\x02\x03\x04\x05\x064\x08\t(\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\n\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f\x07!"#$%&\' )*0,-./+123\x155', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'()*+,-./012345', b'\x00\x01\x02\x03\x04\x05\x06\x15\x08\t \x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\n\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f\x07!"#$%&\'+)*4,-./(12305', b'\x00\x01\x02\x03\x04\x05\x06(\x08\t4\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'0)*\n,-./\x07123+5', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'4)*0,-./+123(5'),
+    (b'\x00\x03\x02+\x04\x05\x06\x01\x08\t\x10\x0b\x0c\r\x0e\x0f\x13\x11\x120\x14\n\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f\x07!"#$%&\'()* ,-./\x1512345', b'\x00\x10\x020\x04\x05\x06\x03\x08\t\x13\x0b\x0c\r\x0e\x0f\x01\x11\x12+\x14\n\x16\x17\x18\x19\x1a\x1b\x1c \x15\x1f\x07!"#$%&\'()*\x1d,-./\x1e12345', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'()*+,-./012345', b'\x00\x01\x02\x03\x04\x05\x06\n\x08\t\x07\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'()*0,-./+12345', b'\x00\x1e\x02\x03\x04\x05\x06\x10\x08\t\x01\x0b\x0c\r\x0e\x0f\x1d\x11\x12\x13\x14\n\x16\x17\x18\x19\x1a\x1b\x1c+0\x1f\x07!"#$%&\'()* ,-./\x1512345', b'\x00\x10\x02\x1d\x04\x05\x06\x13\x08\t\x03\x0b\x0c\r\x0e\x0f\x01\x11\x12\x1e\x140\x16\x17\x18\x19\x1a\x1b\x1c \x15\x1f+!"#$%&\'()*\x07,-./\n12345', b'\x00\x01\x02\x03\x04\x05\x06\x15\x08\t \x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x140\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f+!"#$%&\'()*\n,-./\x0712345', b'\x00\x01\x02\x03\x04\x05\x06\x1d\x08\t\x1e\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\n\x16\x17\x18\x19\x1a\x1b\x1c \x15\x1f\x07!"#$%&\'()*+,-./012345', b'\x00\x01\x02\x03\x04\x05\x06\x1e\x08\t\x1d\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\n\x16\x17\x18\x19\x1a\x1b\x1c \x15\x1f\x07!"#$%&\'()*0,-./+12345', b'\x00\x01\x02\x03\x04\x05\x06 \x08\t\x15\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x140\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f+!"#$%&\'()*\x07,-./\n12345', b'\x00\x01\x02\x03\x04\x05\x06+\x08\t0\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\n\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f\x07!"#$%&\'()* ,-./\x1512345', b'\x00\x01\x02\x03\x04\x05\x060\x08\t+\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\n\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f\x07!"#$%&\'()*\x15,-./ 12345'),
+    (b'\x00\x03\x02+\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x13\x11\x120\x14\x01\x16\x17\x18\x19\x1a\x1b\x1c \x15\x1f\x10!"#$%&\'()*\x1e,-./\x1d12345', b'\x00\x10\x02\x1d\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x01\x11\x12\x1e\x14\x03\x16\x17\x18\x19\x1a\x1b\x1c \x15\x1f\x13!"#$%&\'()*+,-./012345', b'\x00\x1e\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x1d\x11\x12\x13\x14\x10\x16\x17\x18\x19\x1a\x1b\x1c \x15\x1f\x01!"#$%&\'()*0,-./+12345', b'\x00\x10\x02\x1d\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x01\x11\x12\x1e\x14\x13\x16\x17\x18\x19\x1a\x1b\x1c \x15\x1f\x03!"#$%&\'()*0,-./+12345', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'()*+,-./012345', b'\x00\x01\x02 \x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x15\x14\x1d\x16\x17\x18\x19\x1a\x1b\x1c\x13\x03\x1f\x1e!"#$%&\'()*+,-./012345', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x1e\x16\x17\x18\x19\x1a\x1b\x1c0+\x1f\x1d!"#$%&\'()*\x15,-./ 12345', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14 \x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f\x15!"#$%&\'()*0,-./+12345', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14+\x16\x17\x18\x19\x1a\x1b\x1c \x15\x1f0!"#$%&\'()*\x1e,-./\x1d12345', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x140\x16\x17\x18\x19\x1a\x1b\x1c \x15\x1f+!"#$%&\'()*\x1d,-./\x1e12345'),
+    (b'\x00\x1e\x02+\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x1d\x11\x120\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x01\x10\x1f !"#$%&\'()*\x13,-./\x0312345', b'\x00\x10\x020\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x01\x11\x12+\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x03\x13\x1f !"#$%&\'()*\x1d,-./\x1e12345', b'\x000\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f+\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x10\x01\x1f !"#$%&\'()*\x1d,-./\x1e12345', b'\x00\x10\x020\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x01\x11\x12+\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x13\x03\x1f !"#$%&\'()*\x1e,-./\x1d12345', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'()*+,-./012345', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1e\x1d\x1f !"#$%&\'()*0,-./+12345', b'\x00\x1e\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x1d\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c+0\x1f !"#$%&\'()*\x10,-./\x0112345', b'\x00\x1e\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x1d\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c0+\x1f !"#$%&\'()*\x01,-./\x1012345'),
+    (b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'()*+,-./012345', b'\x00\x03\x02+\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x13\x11\x120\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'()*\x01,-./\x1012345', b'\x00\x10\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x01\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'()*0,-./+12345', b'\x00\x13\x02+\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x03\x11\x120\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'()*\x10,-./\x0112345', b'\x00+\x02\x01\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f0\x11\x12\x10\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'()*\x03,-./\x1312345', b'\x000\x02\x01\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f+\x11\x12\x10\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'()*\x13,-./\x0312345'),
+    (b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'()*+,-./012345', b'\x00\x01\x02\x13\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x03\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'()*0,-./+12345'),
+)
+STRONG_GENS = (b'\x06\x03\x00\x07\x04\x01\x08\x05\x02\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\t\n\x0b\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'()*+,-./012345', b'\x00\x01\x02\x03\x04\x05, \x14!\x15\t\x06\r\x0e\x0f\x10\x11\x12\x13-"\x16\n\x07\x19\x1a\x1b\x1c\x1d\x1e\x1f.#\x17\x0b\x08%&\'()*+/$\x18\x0c012345', b'\x00\x01\x0b\x03\x04\x17\x06\x07#\t\n/$\x18\x0c\x08\x10\x11\x12\x13\x14\x15\x162%\x19\r\x05\x1c\x1d\x1e\x1f !"5&\x1a\x0e\x02()*+,-.\'01\x1b34\x0f', b'\x0e\x1a&\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r5\'\x1b\x0f\x02\x13\x14\x15\x16\x17\x18\x194(\x1c\x10\x01\x1f !"#$%3)\x1d\x11\x00+,-./012\x12\x1e*', b')\x01\x02\x1d\x04\x05\x11\x07\x08\x00\n\x0b\x0c\r\x0e\x0f\x103*\x1e\x12\x03\x16\x17\x18\x19\x1a\x1b\x1c0+\x1f\x13\x06"#$%&\'(-, \x14\t./\x1512!45', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f *+,!"#$%&\'()30-41.52/', b'\x00\x01\x02\x03\x04\x05\x06\x07#\t\n/$\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x162%\x19\x1a\x1b\x1c\x1d\x1e\x1f !"\x0b\x08()*\x18\'5+,-.\x0c014&\x173', b'\x00\x01\x02\x03\x04\x05\x06\x07&\t\n5\'\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x164(\x19\x1a\x1b\x1c\x1d\x1e\x1f !\x18*3"#$%\x0b\x08+,-\x17)01.\x0c2/', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !%$/(\'5"*3+,-2#014).&', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x164(\x19\x1a\x1b\x1c\x1d\x1e\x1f !\x18/#%\'5")*+,-\x17$0123.&', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x162%\x19\x1a\x1b\x1c\x1d\x1e\x1f !"/#(\'5\x18)*+,-.$0143\x17&', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%5&(*3+,-./012)4\'', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"/#(&\'+*3%,-.$214)05', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$+&\'%)*(,-./410325', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19%2\x1c\x1d\x1e\x1f !"#$\x1a&\'+)*(,-./41\x1b305', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19+0\x1c\x1d\x1e\x1f !"#$%&\'\x1a)*(,-./4123\x1b5', b'\x00\x01\x02\x03\x044\x06\x07\x08\t\n\x0b\x0c(\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'+)*\r,-./\x0512305', b'\x00\x01\x02\x03\x04%\x06\x07\x08\t\n\x0b\x0c2\x0e\x0f\x10\x11\x12\x13\x14\x15\x160+\x19\r\x05\x1c\x1d\x1e\x1f !4$/\x183)"&\'\x1a,-(#\x1b1\x175.*', b'\x00\x01\x02\x03\x04+\x06\x07\x08\t\n\x0b\x0c0\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\r\x05\x1c\x1d\x1e\x1f !"#$(3)2\'5\x1a,-./\x1b14&%*', b'\x00\x01\x02\x03\x042\x06\x07\x08\t\n\x0b\x0c%\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$\x05&\'0)*(,-./41\r3+5', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'4)*0,-./+123(5', b'\x00\x01\x02\x03\x04+\x06\x07\x08\t\n\x0b\x0c0\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"*3\r&\'%/#4,-.)(1\x05$25', b'\x00\x01\x02\x03\x04\x1b\x06\r\x08\t\x05\x0b\x0c\x1a\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\n\x07\x19+0\x1c\x1d\x1e\x1f !"5&%$/\x18)*(,-.\'4123\x17#', b'\x00\x01\x02\x03\x04\x05\x060\x08\t+\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'\x07)*4,-./(123\n5', b'\x00\x01\x02\x03\x04\x05\x06\n\x08\t\x07\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'()*0,-./+12345', b'\x00\x01\x02\x03\x04\n\x060\x08\t+\x0b\x0c\x07\x0e\x0f\x10\x11\x12\x13\x14%\x16\x1a\x1b\x19\r\x05\x1c\x1d\x1e\x1f2!\x15\'5"*3($/\x18,- &\x171.#4)', b'\x00\x01\x02\x03\x04\x05\x064\x08\t(\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\n\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f\x07!"#$%&\'\x15)*+,-./0123 5', b'\x00\x01\x02\x03\x04\x05\x06+\x08\t0\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\n\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f\x07!"#$%&\'()* ,-./\x1512345', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14 \x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f\x15!"#$%&\'()*0,-./+12345', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c0+\x1f !"#$%&\'\x1d)*4,-./(123\x1e5', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14+\x16\x17\x18\x19\x1a\x1b\x1c \x15\x1f0!"#$%&\'()*\x1e,-./\x1d12345', b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1e\x1d\x1f !"#$%&\'()*0,-./+12345', b'\x00\x15\x02\x03\x04\x05\x060\x08\t+\x0b\x0c\r\x0e\x0f \x11\x12\x13\x14(\x16\x17\x18\x19\x1a\x1b\x1c\x07\n\x1f4!"#$%&\'\x01)*\x1e,-./\x1d123\x105', b'\x00\x1e\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x1d\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c+0\x1f !"#$%&\'()*\x10,-./\x0112345', b'\x00\x10\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x01\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'()*0,-./+12345', b'\x00\x10\x02\x1d\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x01\x11\x12\x1e\x14\x03\x16\x17\x18\x19\x1a\x1b\x1c \x15\x1f\x13!"#$%&\'()*+,-./012345', b'\x00\x10\x020\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x01\x11\x12+\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x13\x03\x1f !"#$%&\'()*\x1e,-./\x1d12345', b'\x00\x03\x02+\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x13\x11\x120\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'()*\x01,-./\x1012345', b'\x00\x01\x02\x13\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x03\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'()*0,-./+12345')
@@ -0,0 +1,60 @@
+"""Regenerate _coset_tables.py: python -m _local._gen_coset_tables
+
+Runs sympy's Schreier-Sims on Cube.GROUP once and writes the resulting
+stabilizer chain out as literals, so that no other process has to.
+"""
+
+from pathlib import Path
+import sys
+
+FORMAT = 1
+
+
+def generate(Cube):
+    import sympy
+    from sympy.combinatorics import Permutation, PermutationGroup
+
+    generators = tuple(Cube.MOVE_TABLES[m] for m in Cube._MOVE_CYCLES)
+    group = PermutationGroup(*(Permutation(list(p)) for p in generators))
+    group.schreier_sims()
+
+    strong_gens = list(group._strong_gens)
+    orbits = [tuple(orbit) for orbit in group._basic_orbits]
+
+    lines = [
+        '# Generated by `python -m _local._gen_coset_tables` -- do not edit.',
+        '"""Stabilizer chain of Cube.GROUP, as computed by sympy\'s Schreier-Sims.',
+        '',
+        'The coset order (Cube.rank()) is defined by this chain, so the file pins',
+        'it down independently of the installed sympy.',
+        '"""',
+        '',
+        f'FORMAT = {FORMAT}',
+        f'SYMPY_VERSION = {sympy.__version__!r}',
+        '',
+        '# The chain is only valid for a group with these generators (U F R B L D)',
+        f'GENERATORS = {generators!r}',
+        '',
+        f'ORDER = {group.order()!r}',
+        f'BASE = {tuple(group._base)!r}',
+        '# ORBITS[i] is the orbit of BASE[i] under the i-th stabilizer, sorted',
+        f'ORBITS = {tuple(orbits)!r}',
+        '# TRANSVERSALS[i][j] maps BASE[i] to ORBITS[i][j]',
+        'TRANSVERSALS = (',
+        *(f'    {tuple(bytes(transversal[beta].array_form) for beta in orbit)!r},' for orbit, transversal in zip(orbits, group._transversals)),
+        ')',
+        f'STRONG_GENS = {tuple(bytes(g.array_form) for g in strong_gens)!r}',
+        '',
+    ]
+    return '\n'.join(lines)
+
+
+def main():
+    from .cube import Cube
+    path = Path(__file__).with_name('_coset_tables.py')
+    path.write_text(generate(Cube))
+    print(f'wrote {path}', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+"""Client for the local encode/decode service (see server.py).
+
+    async with await Client.connect(port=8754) as client:
+        cubes = await client.encode(b'hello')
+        data = await client.decode(cubes)
+
+Protocol: one JSON object per line, in each direction. Requests carry an
+"id", which the response echoes; responses may arrive out of order, so one
+connection can have many requests in flight.
+
+    {"id": 1, "op": "encode", "data": <base64>}      -> {"id": 1, "ok": true, "result": [solverstring, ...]}
+    {"id": 2, "op": "encode", "text": <str50>}       -> (same)
+    {"id": 3, "op": "decode", "cubes": [...]}        -> {"id": 3, "ok": true, "result": <base64>}
+    {"id": 4, "op": "decode", "cubes": [...], "text": true} -> (result: the str50 string)
+    {"id": 5, "op": "solve", "cubes": [...]}         -> (result: creation sequences, in order)
+    {"id": 6, "op": "stats"}                         -> (result: the server's metrics)
+
+Errors: {"id": ..., "ok": false, "error": <message>}.
+
+Only the standard library is imported here, so clients start quickly.
+"""
+
+__all__ = ['Client', 'DEFAULT_PORT']
+
+import asyncio
+from base64 import b64decode, b64encode
+from itertools import count
+import json
+
+DEFAULT_PORT = 8754
+LINE_LIMIT = 1 << 26  # longest accepted line, in bytes
+
+
+class Client:
+    """A connection to the service. Safe to share between tasks."""
+
+    def __init__(self, reader, writer):
+        self._reader = reader
+        self._writer = writer
+        self._ids = count()
+        self._pending = {}  # id -> Future
+        self._receiver = asyncio.ensure_future(self._receive())
+
+    @classmethod
+    async def connect(cls, path=None, *, host='127.0.0.1', port=DEFAULT_PORT):
+        """Connect to the Unix socket at path, or else to host:port."""
+        if path is not None:
+            reader, writer = await asyncio.open_unix_connection(path, limit=LINE_LIMIT)
+        else:
+            reader, writer = await asyncio.open_connection(host, port, limit=LINE_LIMIT)
+        return cls(reader, writer)
+
+    async def encode(self, data):
+        """Return the solverstrings encoding data (bytes-like; or a str, for the str50 codec)."""
+        if isinstance(data, str):
+            return await self._request('encode', text=data)
+        return await self._request('encode', data=b64encode(data).decode('ascii'))
+
+    async def decode(self, cubes, *, text=False):
+        """Return the payload encoded by these cubes (solverstrings or Cubes), as
+        bytes; or as a str50 string, if text is true."""
+        result = await self._request('decode', cubes=[str(c) for c in cubes], text=text)
+        return result if text else b64decode(result)
+
+    async def solve(self, cubes):
+        """Return the creation_sequence of each cube, in order."""
+        return await self._request('solve', cubes=[str(c) for c in cubes])
+
+    async def stats(self):
+        return await self._request('stats')
+
+    async def _request(self, op, **fields):
+        if self._receiver.done():
+            raise ConnectionError('not connected')
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            self._writer.write(json.dumps({'id': request_id, 'op': op, **fields}).encode('utf-8') + b'\n')
+            await self._writer.drain()
+            response = await future
+        finally:
+            self._pending.pop(request_id, None)
+        if not response['ok']:
+            raise ValueError(response['error'])
+        return response['result']
+
+    async def _receive(self):
+        try:
+            while line := await self._reader.readline():
+                response = json.loads(line)
+                future = self._pending.get(response.get('id'))
+                if future is not None and not future.done():
+                    future.set_result(response)
+            error = ConnectionError('connection closed by the server')
+        except Exception as e:
+            error = e
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
+
+    async def close(self):
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except ConnectionError:
+            pass
+        self._receiver.cancel()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
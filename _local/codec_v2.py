@@ -1,75 +1,430 @@
 from .ranking import *
+from .ranking import _A50, _octet_bias, _str50_bias
 from .cube import Cube
-from .multiset42 import Multiset
+from .multiset42 import Multiset, SortedMultiset
+from . import instrument
+
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import chain, count, islice, repeat
+from math import comb, exp, factorial, lgamma, log, log2
+
+__all__ = ['bytes_to_cubes', 'cubes_to_bytes', 'str50_to_cubes', 'cubes_to_str50', 'bytes_to_cubes_many', 'cubes_to_bytes_many', 'IncrementalDecoder', 'bytes_to_ranks', 'ranks_to_bytes', 'estimate', 'calibrate']
+
+
+@instrument.pipeline('codec_v2.bytes_to_cubes')
+def bytes_to_cubes(s, *, Cube=Cube, workers=None, executor=None):
+    with instrument.stage('octet_rank'):
+        x = octet_rank(s)
+    with _executor(workers, executor) as ex:
+        return _nat_to_cubes(x, Cube, ex)
+
+
+@instrument.pipeline('codec_v2.str50_to_cubes')
+def str50_to_cubes(s, *, Cube=Cube, workers=None, executor=None):
+    with instrument.stage('str50_rank'):
+        x = str50_rank(s)
+    with _executor(workers, executor) as ex:
+        return _nat_to_cubes(x, Cube, ex)
+
+
+@instrument.pipeline('codec_v2.cubes_to_bytes')
+def cubes_to_bytes(cs, *, Cube=Cube, workers=None, executor=None, out=None):
+    """Inverse of bytes_to_cubes (which takes any bytes-like object).
+
+    out: write the payload into this writable buffer, or file descriptor,
+     and return its length, instead of returning it as bytes"""
+    with _executor(workers, executor) as ex:
+        x = _cubes_to_nat(cs, Cube, ex)
+    with instrument.stage('octet_unrank'):
+        return octet_unrank(x, out)
+
+
+@instrument.pipeline('codec_v2.cubes_to_str50')
+def cubes_to_str50(cs, *, Cube=Cube, workers=None, executor=None):
+    with _executor(workers, executor) as ex:
+        x = _cubes_to_nat(cs, Cube, ex)
+    with instrument.stage('str50_unrank'):
+        return str50_unrank(x)
+
+
+@instrument.pipeline('codec_v2.bytes_to_cubes_many')
+def bytes_to_cubes_many(ss, *, Cube=Cube, workers=None, executor=None):
+    """Like bytes_to_cubes, for an iterable of payloads.
+
+    The cubes of the whole batch are unranked in one pass (one set of chunks,
+    with workers or executor), rather than payload by payload.
+
+    Returns a list of Multisets."""
+    N = Cube.RANKERS['coset'].order()
+    with instrument.stage('octet_rank'):
+        xs = [octet_rank(s) for s in ss]
+    bags = []
+    for x in xs:
+        instrument.bits('x', x)
+        bags.append(_nat_to_nbag(x, N))
+    instrument.count('cubes', sum(map(len, bags)))
+    with _executor(workers, executor) as ex, instrument.stage('Cube.from_rank'):
+        cubes = _from_ranks(chain.from_iterable(bags), Cube, ex)
+        return [Multiset(islice(cubes, len(ms))) for ms in bags]
+
+
+@instrument.pipeline('codec_v2.cubes_to_bytes_many')
+def cubes_to_bytes_many(css, *, Cube=Cube, workers=None, executor=None):
+    """Like cubes_to_bytes, for an iterable of cube collections.
+
+    The cubes of the whole batch are ranked in one pass, as for
+    bytes_to_cubes_many.
+
+    Returns a list of bytes."""
+    N = Cube.RANKERS['coset'].order()
+    css = [list(cs) for cs in css]
+    with _executor(workers, executor) as ex, instrument.stage('Cube.rank'):
+        js = iter(_to_ranks(chain.from_iterable(css), Cube, ex))
+    instrument.count('cubes', sum(map(len, css)))
+    result = []
+    for cs in css:
+        with instrument.stage('_nbag_to_nat'):
+            x = _nbag_to_nat(list(islice(js, len(cs))), N)
+        instrument.bits('x', x)
+        with instrument.stage('octet_unrank'):
+            result.append(octet_unrank(x))
+    return result
+
+
+@instrument.pipeline('codec_v2.bytes_to_ranks')
+def bytes_to_ranks(s, *, Cube=Cube):
+    """Like bytes_to_cubes, but stop at the cubes' ranks (a SortedMultiset),
+    without constructing any Cube."""
+    with instrument.stage('octet_rank'):
+        x = octet_rank(s)
+    instrument.bits('x', x)
+    js = _nat_to_nbag(x, Cube.RANKERS['coset'].order())
+    instrument.count('cubes', len(js))
+    return js
+
+
+@instrument.pipeline('codec_v2.ranks_to_bytes')
+def ranks_to_bytes(js, *, Cube=Cube, out=None):
+    """Inverse of bytes_to_ranks: cubes_to_bytes, given the cubes' ranks (in any order)."""
+    N = Cube.RANKERS['coset'].order()
+    js = js if isinstance(js, SortedMultiset) else SortedMultiset(js)
+    if js and not 0 <= js.select(0) <= js.select(len(js) - 1) < N:
+        raise ValueError('rank out of range')
+    instrument.count('cubes', len(js))
+    with instrument.stage('_nbag_to_nat'):
+        x = _nbag_to_nat(js, N)
+    instrument.bits('x', x)
+    with instrument.stage('octet_unrank'):
+        return octet_unrank(x, out)
+
+
+def _nat_to_cubes(x, Cube, executor):
+    N = Cube.RANKERS['coset'].order()  # 43_252_003_274_489_856_000
+    instrument.bits('x', x)
+    ms = _nat_to_nbag(x, N)
+    instrument.count('cubes', len(ms))
+    with instrument.stage('Cube.from_rank'):
+        return Multiset(_from_ranks(ms, Cube, executor))
+
+
+def _cubes_to_nat(cs, Cube, executor):
+    N = Cube.RANKERS['coset'].order()  # 43_252_003_274_489_856_000
+    with instrument.stage('Cube.rank'):
+        js = _to_ranks(cs, Cube, executor)
+    instrument.count('cubes', len(js))
+    with instrument.stage('_nbag_to_nat'):
+        x = _nbag_to_nat(js, N)
+    instrument.bits('x', x)
+    return x
+
+
+class IncrementalDecoder:
+    """Decode a message one cube at a time, as the cubes arrive (in any order).
+
+    add() parses, validates and ranks each cube immediately, so bad input is
+    reported at once; finish() or finish_str50() then only has to add up the
+    combination, which needs every cube's final position.
+    """
+
+    def __init__(self, *, Cube=Cube):
+        self._Cube = Cube
+        self._ranks = SortedMultiset()
+
+    def add(self, cube):
+        """Add a cube (or its solverstring). Returns the cube.
+
+        Raises ValueError, leaving the decoder unchanged, if it's not a legal cube."""
+        if isinstance(cube, str):
+            cube = self._Cube(cube)
+        self._ranks.add(cube.rank())
+        return cube
+
+    def __len__(self):
+        return len(self._ranks)
+
+    def _nat(self):
+        return _nbag_to_nat(self._ranks, self._Cube.RANKERS['coset'].order())
+
+    def finish(self, out=None):
+        """Return the payload, as for cubes_to_bytes (including out=)."""
+        return octet_unrank(self._nat(), out)
+
+    def finish_str50(self):
+        """Return the payload, as for cubes_to_str50."""
+        return str50_unrank(self._nat())
+
+
+def estimate(s, codec='bytes', *, Cube=Cube, timing=False):
+    """Return how many cubes s would be encoded into, and roughly how long
+    that would take, without encoding it.
+
+    s: the payload (bytes-like for codec='bytes', str for codec='str50'), or
+     just its length
+    timing: if true, also project encode_seconds and decode_seconds, from the
+     costs measured by calibrate() (which takes about a second, so the first
+     such call runs it unless calibrate() was called already)
+
+    Returns a dict. cubes is the exact count, or None if only the length was
+    given; cubes_min and cubes_max bound it (and equal it when known)."""
+    if codec not in {'bytes', 'str50'}:
+        raise ValueError(f'unknown codec: {codec!r}')
+    N = Cube.RANKERS['coset'].order()
+    if isinstance(s, int):
+        length = s
+        if length < 0:
+            raise ValueError('negative length')
+        cubes_min, cubes_max = _length_bounds(codec, length, N)
+        cubes = cubes_min if cubes_min == cubes_max else None
+    else:
+        length = len(s)
+        x = octet_rank(s) if codec == 'bytes' else str50_rank(s)
+        cubes = cubes_min = cubes_max = _nbag_size_fast(x, N)
+    result = {'codec': codec, 'length': length, 'cubes': cubes, 'cubes_min': cubes_min, 'cubes_max': cubes_max}
+    if timing:
+        costs = _costs or calibrate(Cube=Cube)
+        result['encode_seconds'] = _project(costs['encode'], cubes_max)
+        result['decode_seconds'] = _project(costs['decode'], cubes_max)
+    return result
+
+
+def calibrate(*, Cube=Cube):
+    """Measure the per-stage costs that estimate() projects from (about a second).
+
+    Returns them as {'encode': ..., 'decode': ...}: per-cube seconds for the
+    work done cube by cube, and a * cubes**p seconds for the big-integer
+    arithmetic, which grows faster than linearly."""
+    global _costs
+    samples = []
+    for length in _CALIBRATION_LENGTHS:
+        data = bytes(range(256)) * (length // 256) + bytes(length % 256)
+        with instrument.instrument('calibrate') as encode_job:
+            cs = bytes_to_cubes(data, Cube=Cube)
+        with instrument.instrument('calibrate') as decode_job:
+            cubes_to_bytes(cs, Cube=Cube)
+        samples.append((len(cs), encode_job, decode_job))
+    _costs = {
+        'encode': _fit([(k, e.seconds, e.stages['Cube.from_rank'][1]) for k, e, d in samples]),
+        'decode': _fit([(k, d.seconds, d.stages['Cube.rank'][1]) for k, e, d in samples]),
+    }
+    return _costs
+
+
+_costs = None
+_CALIBRATION_LENGTHS = (800, 3200)
+
+
+def _fit(samples):
+    # samples: (cubes, total seconds, seconds spent cube by cube); the rest is
+    # fitted as a * cubes**p through the smallest and largest sample
+    (k0, t0, c0), (k1, t1, c1) = samples[0], samples[-1]
+    per_cube = (c0 + c1) / (k0 + k1)
+    r0, r1 = max(t0 - c0, 1e-9), max(t1 - c1, 1e-9)
+    p = max(1.0, log(r1 / r0) / log(k1 / k0))
+    return {'per_cube': per_cube, 'a': r1 / k1**p, 'p': p}
+
+
+def _project(cost, k):
+    return cost['per_cube'] * k + cost['a'] * k**cost['p']
+
+
+def _length_bounds(codec, length, n):
+    # Every payload of this length ranks between the number of shorter
+    # payloads and the number of payloads no longer than it, minus one
+    if codec == 'bytes':
+        base, bias = 256, _octet_bias
+    else:
+        base, bias = len(_A50), _str50_bias
+    if length * log2(base) > 64:
+        # bias(length) == (base**length - 1) // (base - 1), to within 2**-64
+        lo = _nbag_size_log2(length * log2(base) - log2(base - 1), n)
+        hi = _nbag_size_log2((length + 1) * log2(base) - log2(base - 1), n)
+        if lo is not None and hi is not None:
+            return lo, hi
+        if length * log2(base) > _MAX_EXACT_BITS:
+            # bias(length) alone would take gigabytes
+            raise ValueError(f'length too large to estimate exactly: {length}')
+    return _nbag_size(bias(length), n), _nbag_size(bias(length + 1) - 1, n)
+
+
+_MAX_EXACT_BITS = 1 << 27
+
+
+def _nbag_size_fast(x, n):
+    """Same as _nbag_size(x, n), but from floating-point logarithms where
+    that is unambiguous, which doesn't need any huge binomial coefficient."""
+    if x < 1 << 64:
+        return _nbag_size(x, n)
+    shift = x.bit_length() - 64
+    k = _nbag_size_log2(log2(x >> shift) + shift, n)
+    return _nbag_size(x, n) if k is None else k
+
+
+def _nbag_size_log2(log2_x, n):
+    # _nbag_size, given log2(x); None if that can't decide it
+    # Largest k with log2(_bias(n, k)) <= log2_x: gallop, then bisect
+    lo, hi = 1, 2
+    while _log2_bias(n, hi) <= log2_x:
+        lo, hi = hi, hi * 2
+        if hi**3 > n * n:
+            return None  # outside the approximation's range
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if _log2_bias(n, mid) <= log2_x:
+            lo = mid
+        else:
+            hi = mid
+    # Consecutive biases are at least log2(n**(1/3)) bits apart; only fall
+    # back to exact arithmetic if x is within rounding (and truncation)
+    # error of one
+    margin = 1e-14 * log2_x + 1e-6
+    if log2_x - _log2_bias(n, lo) < margin or _log2_bias(n, lo + 1) - log2_x < margin:
+        return None
+    return lo
+
+
+def _log2_bias(n, k):
+    # log2(_bias(n, k)) for 1 <= k <= n**(2/3):
+    # C(n+k-1, k-1) == prod((n + i) / i for i in range(1, k)), and
+    # sum(log(1 + i/n) for i in range(1, k)) ~= k*(k-1) / 2n - (k-1)*k*(2k-1) / 12n**2,
+    # to within k**4 / 12n**3 (which is below 1e-7 there)
+    log_growth = k * (k - 1) / (2 * n) - (k - 1) * k * (2 * k - 1) / (12 * n * n)
+    return (k - 1) * log2(n) + (log_growth - lgamma(k)) / log(2)
+
+
+# Per-cube rank/unrank can be sharded across processes by passing
+# workers=N (a private ProcessPoolExecutor) or executor=... (any Executor).
+# Cubes cross the process boundary as their 54-byte array form, so neither
+# side repeats the other's work; results are identical to the serial path.
+
+_CHUNK_SIZE = 1024
+
 
-from itertools import count
-from math import comb
-import sys
+@contextmanager
+def _executor(workers, executor):
+    if executor is not None:
+        yield executor
+    elif workers is not None and workers > 1:
+        from concurrent.futures import ProcessPoolExecutor  # deferred: multiprocessing is slow to import
+        with ProcessPoolExecutor(workers) as ex:
+            yield ex
+    else:
+        yield None
 
-__all__ = ['bytes_to_cubes', 'cubes_to_bytes', 'str50_to_cubes', 'cubes_to_str50']
 
+def _from_ranks(js, Cube, executor):
+    if executor is None:
+        return map(Cube.from_rank, js)
+    chunks = executor.map(_unrank_chunk, repeat(Cube), _chunked(js, _CHUNK_SIZE))
+    return map(Cube._from_array, chain.from_iterable(chunks))
 
-def bytes_to_cubes(s, *, Cube=Cube):
-    N = Cube.GROUP.order()  # 43_252_003_274_489_856_000
-    x = octet_rank(s)
-    cs = Multiset()
-    for j in _nat_to_nbag(x, N):
-        p = Cube.GROUP.coset_unrank(j)
-        c = Cube(p)
-        cs.add(c)
-    return cs
 
+def _to_ranks(cs, Cube, executor):
+    if executor is None:
+        return [c.rank() for c in cs]
+    chunks = executor.map(_rank_chunk, repeat(Cube), _chunked((c._array for c in cs), _CHUNK_SIZE))
+    return list(chain.from_iterable(chunks))
 
-def str50_to_cubes(s, *, Cube=Cube):
-    N = Cube.GROUP.order()
-    x = str50_rank(s)
-    cs = Multiset()
-    for j in _nat_to_nbag(x, N):
-        p = Cube.GROUP.coset_unrank(j)
-        c = Cube(p)
-        cs.add(c)
-    return cs
 
+def _unrank_chunk(Cube, js):
+    return [Cube.from_rank(j)._array for j in js]
 
-def cubes_to_bytes(cs, *, Cube=Cube):
-    N = Cube.GROUP.order()  # 43_252_003_274_489_856_000
-    js = ( Cube.GROUP.coset_rank(c._permutation) for c in cs )
-    x = _nbag_to_nat(js, N)
-    return octet_unrank(x)
 
+def _rank_chunk(Cube, ps):
+    return [Cube._from_array(p).rank() for p in ps]
 
-def cubes_to_str50(cs, *, Cube=Cube):
-    N = Cube.GROUP.order()  # 43_252_003_274_489_856_000
-    js = ( Cube.GROUP.coset_rank(c._permutation) for c in cs )
-    x = _nbag_to_nat(js, N)
-    return str50_unrank(x)
+
+def _chunked(iterable, n):
+    it = iter(iterable)
+    return iter(lambda: list(islice(it, n)), [])
+
+
+@lru_cache(maxsize=1024)
+def _bias(n, k):
+    """Return the number of n-multisets with fewer than k elements.
+
+    sum(multicomb(n, i) for i in range(k)) == comb(n + k - 1, k - 1)
+    (https://en.wikipedia.org/wiki/Hockey-stick_identity)
+    """
+    if k == 0:
+        return 0
+    return comb(n + k - 1, k - 1)
+
+
+def _nbag_size(x, n):
+    """Return the number of elements in the n-multiset numbered x."""
+    # Largest k with _bias(n, k) <= x: gallop, then bisect
+    lo, hi = 0, 1
+    while _bias(n, hi) <= x:
+        lo, hi = hi, hi * 2
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if _bias(n, mid) <= x:
+            lo = mid
+        else:
+            hi = mid
+    return lo
 
 
 def _nat_to_nbag(x, n):
-    if x == 0: return Multiset()
+    if x == 0: return SortedMultiset()
     # 1. Calculate k
-    bias = 1
-    k = 1
-    while not (x - bias) in range(multicomb(n, k)):
-        bias += multicomb(n, k)
-        k += 1
+    with instrument.stage('_nbag_size'):
+        k = _nbag_size(x, n)
+        bias = _bias(n, k)
 
-    # 2. Natural -> Combination
-    s = _nat_to_kcomb(x - bias, k)
+    # 2. Natural -> Combination (in descending order)
+    with instrument.stage('_nat_to_kcomb'):
+        s = _nat_to_kcomb(x - bias, k)
 
     # 3. Combination -> Multiset
-    return Multiset( (elem - i) for (i, elem) in enumerate(sorted(s)) )
+    # (the i-th smallest element of the combination is the i-th smallest of the multiset, plus i)
+    counts = {}
+    for i, elem in enumerate(reversed(s)):
+        counts[elem - i] = counts.get(elem - i, 0) + 1
+    return SortedMultiset.fromcounts(counts)
 
 
 def _nbag_to_nat(ms, n):
-    # 1. Multiset -> Combination
-    s = set( (x + i) for (i, x) in enumerate(sorted(ms)) )
-
-    # 2. Calculate bias
-    bias = sum(multicomb(n, k) for k in range(len(s)))
-
-    # 3. Combination -> Natural
-    return _kcomb_to_nat(s) + bias
+    if not isinstance(ms, SortedMultiset):
+        ms = SortedMultiset(ms)
+
+    # 1. Calculate bias
+    bias = _bias(n, len(ms))
+
+    # 2. Multiset -> Combination -> Natural
+    # An element x of multiplicity m, with r elements below it, stands for the
+    # combination elements x+r, ..., x+r+m-1, which contribute
+    #   C(x+r, r+1) + ... + C(x+r+m-1, r+m) == C(x+r+m, r+m) - C(x+r, r)
+    x = 0
+    r = 0
+    for elem, m in ms.items():
+        if m == 1:
+            x += comb(elem + r, r + 1)
+        else:
+            x += comb(elem + r + m, r + m) - comb(elem + r, r)
+        r += m
+    return x + bias
 
 
 def _nat_to_kcomb(x, k):
@@ -79,12 +434,31 @@ def _nat_to_kcomb(x, k):
     if k < 1 and x > 0:
         raise ValueError(f"can't represent {x} as a {k}-combination (k too small)")
 
-    result = set()
-    for i in reversed(range(k)):
-        elem = _search_maxsatisfying(lambda n: not comb(n, i+1) > x)  # TODO performance
-        assert elem not in result
-        result.add(elem)
-        x -= comb(elem, i+1)
+    result = []  # in descending order
+    upper_bound = None
+    f = factorial(k)  # i!
+    for i in reversed(range(1, k+1)):
+        # C(c, i) ~= (c - (i-1)/2)**i / i!, so start from the i-th root of x * i!
+        elem = _iroot(x * f, i) + (i - 1) // 2
+        if upper_bound is not None:
+            elem = min(elem, upper_bound)
+        elem = max(elem, i - 1)
+        b = comb(elem, i)
+        # then walk to the largest elem with C(elem, i) <= x,
+        # updating the binomial by ratio
+        while b > x:
+            b = b * (elem - i) // elem
+            elem -= 1
+        while True:
+            b_next = b * (elem + 1) // (elem + 1 - i) if elem + 1 > i else 1
+            if b_next > x:
+                break
+            elem += 1
+            b = b_next
+        result.append(elem)
+        x -= b
+        upper_bound = elem - 1
+        f //= i
     return result
 
 
@@ -96,38 +470,23 @@ def _kcomb_to_nat(s):
     return sum(comb(elem, i+1) for i, elem in enumerate(sorted(s)))
 
 
+def _iroot(n, k):
+    """Return the largest integer r with r**k <= n."""
+    if n < 2 or k == 1:
+        return n
+    # Seed from above with a floating-point estimate, then Newton's method
+    try:
+        r = int(exp(log(n) / k) * (1 + 2**-40)) + 1
+    except OverflowError:
+        r = 1 << -(-n.bit_length() // k)
+    while True:
+        y = ((k - 1) * r + n // r**(k - 1)) // k
+        if y >= r:
+            return r
+        r = y
+
+
 def multicomb(n, k):
     """https://en.wikipedia.org/wiki/Multiset_coefficient
     """
     return comb((n + k - 1), k)
-
-
-def _search_maxsatisfying(predicate, *, start=0, _increasefunc=lambda n, base=sys.maxsize+1: n*base):
-    """Return the largest integer *n* for which predicate(n) succeeds
-
-    predicate must have a nowhere-positive derivative.
-    start value must satisfy predicate."""
-    if start < 0:
-        offset = -start
-        return search_maxsatisfying(lambda guess: predicate(guess - offset), start=0, _increasefunc=_increasefunc) - offset
-    lower_bound = start
-    upper_bound = lower_bound + 1
-    if not predicate(lower_bound):
-        raise ValueError("start value does not satisfy predicate")
-
-    # 1. Exponential approach to establish upper-bound
-    while predicate(upper_bound):
-        lower_bound, upper_bound = upper_bound, _increasefunc(upper_bound)
-    guess = lower_bound
-
-    # 2. Binary search
-    while (upper_bound - lower_bound) > 1:
-        guess = lower_bound + (upper_bound - lower_bound) // 2
-        if not predicate(guess):
-            upper_bound = guess
-            guess = lower_bound
-        else:
-            lower_bound = guess
-
-    assert predicate(guess) and not predicate(guess+1)
-    return guess
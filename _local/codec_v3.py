@@ -0,0 +1,117 @@
+"""Streaming block codec.
+
+The payload is cut into blocks of BLOCK_SIZE bytes; each block, together with
+a small header, is mapped to exactly CUBES_PER_BLOCK cubes (in cubie rank
+order), so a stream of any length is encoded and decoded in constant memory.
+
+Block layout, as one integer written in base N (N = number of cube states),
+least significant cube first:
+
+    ((seq * (BLOCK_SIZE + 1) + length) * 256**BLOCK_SIZE) + data
+
+ - seq: block number, modulo SEQ_MODULUS, to catch missing or misordered blocks
+ - length: number of payload bytes in the block; less than BLOCK_SIZE marks
+   the final block (a stream whose length is a multiple of BLOCK_SIZE ends
+   with an empty block)
+ - data: the payload bytes, zero-padded to BLOCK_SIZE, big-endian
+"""
+
+from .cube import Cube
+
+from io import BytesIO
+
+__all__ = ['iter_encode', 'iter_decode', 'encode_block', 'decode_block', 'bytes_to_cubes', 'cubes_to_bytes']
+
+BLOCK_SIZE = 128
+CUBES_PER_BLOCK = 16
+SEQ_MODULUS = 4096
+
+_ORDER = 'cubie'
+
+
+def iter_encode(f, *, Cube=Cube):
+    """Yield the cubes encoding the binary file object f."""
+    seq = 0
+    while True:
+        data = _read_block(f)
+        yield from encode_block(seq, data, Cube=Cube)
+        if len(data) < BLOCK_SIZE:
+            return
+        seq += 1
+
+
+def _read_block(f):
+    # Unbuffered files and pipes can return short reads before the end;
+    # only EOF (an empty read) makes a block short
+    data = f.read(BLOCK_SIZE)
+    while data and len(data) < BLOCK_SIZE:
+        more = f.read(BLOCK_SIZE - len(data))
+        if not more:
+            break
+        data += more
+    return data
+
+
+def iter_decode(cs, *, Cube=Cube):
+    """Yield the payload chunks encoded by the cubes cs, in order."""
+    cs = iter(cs)
+    seq = 0
+    while True:
+        block = [c for _, c in zip(range(CUBES_PER_BLOCK), cs)]
+        if len(block) < CUBES_PER_BLOCK:
+            raise ValueError(f'truncated stream: block {seq} is incomplete')
+        block_seq, data, final = decode_block(block, Cube=Cube)
+        if block_seq != seq % SEQ_MODULUS:
+            raise ValueError(f'expected block {seq % SEQ_MODULUS}, got block {block_seq}')
+        yield data
+        if final:
+            break
+        seq += 1
+    if next(cs, None) is not None:
+        raise ValueError('trailing cubes after the final block')
+
+
+def encode_block(seq, data, *, Cube=Cube):
+    """Return the CUBES_PER_BLOCK cubes encoding block number seq.
+
+    data must be at most BLOCK_SIZE bytes; a short block is a final block."""
+    if not len(data) <= BLOCK_SIZE:
+        raise ValueError(f'block too long: {len(data)} bytes')
+    N = Cube.RANKERS[_ORDER].order()
+    x = (seq % SEQ_MODULUS) * (BLOCK_SIZE + 1) + len(data)
+    x = (x << (8 * BLOCK_SIZE)) | int.from_bytes(bytes(data).ljust(BLOCK_SIZE, b'\0'), 'big')
+    result = []
+    for _ in range(CUBES_PER_BLOCK):
+        x, j = divmod(x, N)
+        result.append(Cube.from_rank(j, _ORDER))
+    assert x == 0
+    return result
+
+
+def decode_block(cs, *, Cube=Cube):
+    """Inverse of encode_block. Returns (seq, data, final)."""
+    if len(cs) != CUBES_PER_BLOCK:
+        raise ValueError(f'a block is {CUBES_PER_BLOCK} cubes, got {len(cs)}')
+    N = Cube.RANKERS[_ORDER].order()
+    x = 0
+    for c in reversed(cs):
+        x = x * N + c.rank(_ORDER)
+    header, data = divmod(x, 1 << (8 * BLOCK_SIZE))
+    seq, length = divmod(header, BLOCK_SIZE + 1)
+    if not seq < SEQ_MODULUS:
+        raise ValueError('not a codec_v3 block')
+    data = data.to_bytes(BLOCK_SIZE, 'big')
+    if any(data[length:]):
+        raise ValueError('not a codec_v3 block (nonzero padding)')
+    return seq, data[:length], length < BLOCK_SIZE
+
+
+def bytes_to_cubes(s, *, Cube=Cube):
+    return list(iter_encode(BytesIO(s), Cube=Cube))
+
+
+def cubes_to_bytes(cs, *, Cube=Cube):
+    return b''.join(iter_decode(cs, Cube=Cube))
+
+
+assert SEQ_MODULUS * (BLOCK_SIZE + 1) << (8 * BLOCK_SIZE) <= Cube.RANKERS[_ORDER].order() ** CUBES_PER_BLOCK
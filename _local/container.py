@@ -0,0 +1,163 @@
+"""Packed binary container for encoded cube lists.
+
+A cube carries about 65.2 bits, so instead of one 54-character solverstring
+per cube, the container stores one fixed-width rank record per cube:
+
+    header (16 bytes, big-endian):
+        magic   b'RSDC'
+        version u8   (FORMAT_VERSION)
+        codec   u8   (2: codec_v2, coset ranks in ascending order;
+                      3: codec_v3, cubie ranks in stream order)
+        (2 reserved bytes, zero)
+        count   u64  number of records
+    count records of RECORD_SIZE bytes: the cube's rank, big-endian
+
+Records can be read straight out of a memory-mapped file (Reader.open)
+without constructing any Cube, and a codec_v2 payload decodes from the ranks
+alone (codec_v2.ranks_to_bytes).
+"""
+
+from . import codec_v2, codec_v3
+from .cube import Cube
+from .ranking import _write_out
+
+import mmap
+import struct
+
+__all__ = ['pack', 'pack_ranks', 'encode', 'Reader', 'RECORD_SIZE', 'FORMAT_VERSION']
+
+MAGIC = b'RSDC'
+FORMAT_VERSION = 1
+RECORD_SIZE = 9
+
+_HEADER = struct.Struct('>4sBB2xQ')
+_RECORD = struct.Struct('>BQ')  # a 72-bit rank, as its top byte and low 64 bits
+
+_CHUNK_RECORDS = 4096
+
+# codec -> the rank order its records are written in
+_ORDERS = {2: 'coset', 3: 'cubie'}
+
+assert _RECORD.size == RECORD_SIZE and max(Cube.RANKERS[order].order() for order in _ORDERS.values()) <= 1 << (8 * RECORD_SIZE)
+
+
+def pack_ranks(ranks, *, codec=2):
+    """Return the container holding these ranks (in the codec's order).
+
+    codec_v2 ranks are stored sorted; codec_v3 ranks are kept in order."""
+    _check_codec(codec)
+    ranks = sorted(ranks) if codec == 2 else list(ranks)
+    N = Cube.RANKERS[_ORDERS[codec]].order()
+    if ranks and not 0 <= min(ranks) <= max(ranks) < N:
+        raise ValueError('rank out of range')
+    return b''.join([
+        _HEADER.pack(MAGIC, FORMAT_VERSION, codec, len(ranks)),
+        *(_RECORD.pack(j >> 64, j & 0xFFFF_FFFF_FFFF_FFFF) for j in ranks),
+    ])
+
+
+def pack(cs, *, codec=2):
+    """Return the container holding the cubes cs, as encoded by codec_v2 or codec_v3."""
+    _check_codec(codec)
+    order = _ORDERS[codec]
+    return pack_ranks((c.rank(order) for c in cs), codec=codec)
+
+
+def encode(s, *, codec=2):
+    """Encode the payload s straight into a container.
+
+    With codec=2, no Cube is constructed."""
+    _check_codec(codec)
+    if codec == 2:
+        return pack_ranks(codec_v2.bytes_to_ranks(s), codec=2)
+    return pack(codec_v3.bytes_to_cubes(s), codec=3)
+
+
+def _check_codec(codec):
+    if codec not in _ORDERS:
+        raise ValueError(f'unsupported codec: {codec!r}')
+
+
+class Reader:
+    """Read a container from any bytes-like object, or a memory-mapped file.
+
+    Records are parsed on demand: len(), [i] and ranks() never construct a Cube.
+    """
+
+    def __init__(self, buffer):
+        self._mmap = None
+        view = memoryview(buffer).cast('B')
+        if len(view) < _HEADER.size:
+            raise ValueError('not a cube container (too short)')
+        magic, version, codec, count = _HEADER.unpack_from(view)
+        if magic != MAGIC:
+            raise ValueError('not a cube container')
+        if version != FORMAT_VERSION:
+            raise ValueError(f'unsupported container version: {version}')
+        _check_codec(codec)
+        if len(view) != _HEADER.size + count * RECORD_SIZE:
+            raise ValueError(f'truncated cube container: expected {count} records')
+        self.codec = codec
+        self.order = _ORDERS[codec]
+        self._records = view[_HEADER.size:]
+        self._count = count
+
+    @classmethod
+    def open(cls, path):
+        """Memory-map the container at path. Close the Reader (or use it as a
+        context manager) to release the file."""
+        with open(path, 'rb') as f:
+            m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self = cls(m)
+        except BaseException:
+            m.close()
+            raise
+        self._mmap = m
+        return self
+
+    def close(self):
+        m, self._mmap = self._mmap, None
+        try:
+            self._records.release()
+        finally:
+            if m is not None:
+                m.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, i):
+        """Return the i-th rank."""
+        if not -self._count <= i < self._count:
+            raise IndexError(i)
+        hi, lo = _RECORD.unpack_from(self._records, (i % self._count) * RECORD_SIZE)
+        return hi << 64 | lo
+
+    def ranks(self):
+        """Iterate over the ranks."""
+        # A chunk at a time, copied out: an iterator left unfinished holds no
+        # buffer export that would stop close() from releasing the file
+        records = self._records
+        step = _CHUNK_RECORDS * RECORD_SIZE
+        for start in range(0, len(records), step):
+            chunk = records[start:start + step].tobytes()
+            yield from (hi << 64 | lo for hi, lo in _RECORD.iter_unpack(chunk))
+
+    def cubes(self, *, Cube=Cube):
+        """Iterate over the cubes."""
+        order = self.order
+        return (Cube.from_rank(j, order) for j in self.ranks())
+
+    def decode(self, *, Cube=Cube, out=None):
+        """Return the payload (or write it to out, as for codec_v2.cubes_to_bytes)."""
+        if self.codec == 2:
+            return codec_v2.ranks_to_bytes(self.ranks(), Cube=Cube, out=out)
+        s = codec_v3.cubes_to_bytes(self.cubes(Cube=Cube), Cube=Cube)
+        return s if out is None else _write_out(s, out)
@@ -1,18 +1,84 @@
-import sympy.combinatorics  # python -m pip install "sympy >= 0.7.2"
-import kociemba as _kociemba  # python -m pip install "kociemba >= 1.2"
+from itertools import chain, permutations
+from operator import itemgetter
+from random import randrange
+
+import sys
+
+# sympy (python -m pip install "sympy >= 0.7.2") and kociemba (python -m pip
+# install "kociemba >= 1.2") are imported only when first needed
+
+from . import instrument
+from .cuberank import CosetRanker, CubieRanker
+from .solutions import SolutionCache
+
+# Pads a 54-byte state out to a bytes.translate() table
+_TRANSLATE_PAD = bytes(range(54, 256))
+
+
+def _af_from_cycles(cycles, size=54):
+    # Array form of a permutation given in sympy's cycle notation
+    p = list(range(size))
+    for cycle in cycles:
+        for a, b in zip(cycle, cycle[1:] + cycle[:1]):
+            p[a] = b
+    return bytes(p)
+
+
+def _af_power(p, n):
+    # Same as sympy's Permutation.__pow__, for n >= 1
+    result = p
+    for _ in range(n - 1):
+        result = result.translate(p + _TRANSLATE_PAD)
+    return result
+
+
+def _stabilizer_chain(move_tables, names):
+    # The precomputed stabilizer chain, if it was computed for these moves
+    from . import _coset_tables
+    if _coset_tables.GENERATORS != tuple(move_tables[m] for m in names):
+        return None
+    return _coset_tables
+
+
+def _kociemba_solve(facelets):
+    import kociemba
+    return kociemba.solve(facelets)
+
+
+def _is_sympy_permutation(x):
+    # sympy can't have made x if it was never imported
+    permutations = sys.modules.get('sympy.combinatorics.permutations')
+    return permutations is not None and isinstance(x, permutations.Permutation)
+
+
+class _LazyClassAttribute:
+    # Computed from the class on first access, then stored on it
+    def __init__(self, f):
+        self.f = f
+        self.__doc__ = f.__doc__
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, owner):
+        value = self.f(owner)
+        setattr(owner, self.name, value)
+        return value
 
 
 class Cube:
     """Immutable class representing a Rubik's Cube.
 
     May represent "illegal" states.
+
+    The state is stored as 54 bytes: byte i is the number of the sticker that
+    landed in position i (the array form of the permutation).
     """
-    __slots__ = ['__impl', '_hash']
+    __slots__ = ['__impl', '_key']
 
     @classmethod
     def random_cube(cls):
-        p = cls.GROUP.random()
-        return cls(p)
+        return cls.from_rank(randrange(cls.RANKERS['cubie'].order()), 'cubie')
 
     _COLORS = (15, 10, 1, 4, 3, 11)  # Override this to re-color a subclass!
     _COLOR_LETTERS = ('w', 'g', 'r', 'b', 'o', 'y')
@@ -30,17 +96,48 @@ class Cube:
         5, 5, 5,
     )
 
+    @property
+    def key(self):
+        """An integer identifying this state, the same in every process.
+
+        The cubie rank for legal states; a negative number packing all 54
+        stickers for illegal ones."""
+        if self._key is None:
+            try:
+                self._key = self.RANKERS['cubie'].rank(self.__impl)
+            except ValueError:
+                self._key = ~int.from_bytes(self.__impl, 'big')
+        return self._key
+
     def __hash__(self):
-        if self._hash is None:
-            self._hash = hash( (self._permutation, frozenset(frozenset(piece) for piece in self.POLYHEDRON_FACES), self.GROUP))
-        return self._hash
+        return hash(self.key)
+
+    # Solver results, shared by all cubes; call SOLUTIONS.persist() to keep them on disk
+    SOLUTIONS = SolutionCache(_kociemba_solve, warmup='UUUUUUUUURRRRRRRRRFFFFFFFFFDDDDDDDDDLLLLLLLLLBBBBBBBBB')
+
+    @property
+    def creation_sequence(self):
+        """A move sequence that takes the solved cube to this state, e.g. "R U R' U'"."""
+        solution = self.SOLUTIONS(self._alt_str('github.com/muodov/kociemba')).split()
+        return ' '.join(_inverse_move(m) for m in reversed(solution))
+
+    @classmethod
+    @instrument.pipeline('Cube.solve_many')
+    def solve_many(cls, cubes, *, workers=None):
+        """Return the creation_sequence of each cube, in order.
+
+        Unsolved cubes are solved in a pool of worker processes (default:
+        one per CPU); later reprs of these cubes are served from SOLUTIONS."""
+        solutions = cls.SOLUTIONS.solve_many((c._alt_str('github.com/muodov/kociemba') for c in cubes), workers=workers)
+        return [' '.join(_inverse_move(m) for m in reversed(solution.split())) for solution in solutions]
 
     def __repr__(self):
+        return self._render(self.creation_sequence)
+
+    def _render(self, creation_str):
+        # repr(), given the creation_sequence (e.g. from solve_many())
         stickers = [self._COLORS[self._COLOR_INDICES[i]] for i in self.__impl]
         solverstring = ''.join(self._COLOR_LETTERS[self._COLOR_INDICES[i]] for i in self.__impl)
-        solution = [self.MOVES[m] for m in _kociemba.solve(self._alt_str('github.com/muodov/kociemba')).split()]
-        creation = [~m for m in reversed(solution)]
-        creation_str = ' '.join(_dindex(self.MOVES, m) for m in creation)
         #if inspect.stack()[1].filename != '<stdin>':
         #    # https://stackoverflow.com/questions/77719065
         #    return f'{self.__class__.__name__}({solverstring!r})'
@@ -84,79 +181,174 @@ class Cube:
             '\n'
         ).format(stickers=stickers, solverstring=solverstring, creation_str=creation_str)
 
-    MOVES = {
-        'U': sympy.combinatorics.Permutation(53)( 0,  6,  8,  2)( 1,  3,  7,  5)( 9, 12, 15, 18)(10, 13, 16, 19)(11, 14, 17, 20),
-        'F': sympy.combinatorics.Permutation(53)( 6, 44, 47, 12)( 7, 32, 46, 24)( 8, 20, 45, 36)( 9, 33, 35, 11)(10, 21, 34, 23),
-        'R': sympy.combinatorics.Permutation(53)( 2, 11, 47, 39)( 5, 23, 50, 27)( 8, 35, 53, 15)(12, 36, 38, 14)(13, 24, 37, 26),
-        'B': sympy.combinatorics.Permutation(53)( 0, 14, 53, 42)( 1, 26, 52, 30)( 2, 38, 51, 18)(15, 39, 41, 17)(16, 27, 40, 29),
-        'L': sympy.combinatorics.Permutation(53)( 0, 41, 45,  9)( 3, 29, 48, 21)( 6, 17, 51, 33)(18, 42, 44, 20)(19, 30, 43, 32),
-        'D': sympy.combinatorics.Permutation(53)(33, 42, 39, 36)(34, 43, 40, 37)(35, 44, 41, 38)(45, 51, 53, 47)(46, 48, 52, 50),
+    # Face turns, in sympy's cycle notation
+    _MOVE_CYCLES = {
+        'U': (( 0,  6,  8,  2), ( 1,  3,  7,  5), ( 9, 12, 15, 18), (10, 13, 16, 19), (11, 14, 17, 20)),
+        'F': (( 6, 44, 47, 12), ( 7, 32, 46, 24), ( 8, 20, 45, 36), ( 9, 33, 35, 11), (10, 21, 34, 23)),
+        'R': (( 2, 11, 47, 39), ( 5, 23, 50, 27), ( 8, 35, 53, 15), (12, 36, 38, 14), (13, 24, 37, 26)),
+        'B': (( 0, 14, 53, 42), ( 1, 26, 52, 30), ( 2, 38, 51, 18), (15, 39, 41, 17), (16, 27, 40, 29)),
+        'L': (( 0, 41, 45,  9), ( 3, 29, 48, 21), ( 6, 17, 51, 33), (18, 42, 44, 20), (19, 30, 43, 32)),
+        'D': ((33, 42, 39, 36), (34, 43, 40, 37), (35, 44, 41, 38), (45, 51, 53, 47), (46, 48, 52, 50)),
     }
 
-    GROUP = sympy.combinatorics.PermutationGroup(*MOVES.values())
-
     POLYHEDRON_FACES = [
         (1, 16), (3, 19), (5, 13), (7, 10), (21, 32), (23, 24), (26, 27), (29, 30), (34, 46), (37, 50), (40, 52), (43, 48),
         (0, 18, 17), (2, 15, 14), (6, 9, 20), (8, 12, 11), (33, 45, 44), (35, 36, 47), (38, 39, 53), (41, 42, 51),
         (4,), (22,), (25,), (28,), (31,), (49,),
     ]
 
-    MOVES['U2'] = MOVES['U']**2
-    MOVES['F2'] = MOVES['F']**2
-    MOVES['R2'] = MOVES['R']**2
-    MOVES['B2'] = MOVES['B']**2
-    MOVES['L2'] = MOVES['L']**2
-    MOVES['D2'] = MOVES['D']**2
+    # The moves, as index tables for bytes.translate()
+    MOVE_TABLES = {m: _af_from_cycles(cycles) for m, cycles in _MOVE_CYCLES.items()}
+
+    MOVE_TABLES['U2'] = _af_power(MOVE_TABLES['U'], 2)
+    MOVE_TABLES['F2'] = _af_power(MOVE_TABLES['F'], 2)
+    MOVE_TABLES['R2'] = _af_power(MOVE_TABLES['R'], 2)
+    MOVE_TABLES['B2'] = _af_power(MOVE_TABLES['B'], 2)
+    MOVE_TABLES['L2'] = _af_power(MOVE_TABLES['L'], 2)
+    MOVE_TABLES['D2'] = _af_power(MOVE_TABLES['D'], 2)
+
+    MOVE_TABLES["U'"] = _af_power(MOVE_TABLES['U'], 3)
+    MOVE_TABLES["F'"] = _af_power(MOVE_TABLES['F'], 3)
+    MOVE_TABLES["R'"] = _af_power(MOVE_TABLES['R'], 3)
+    MOVE_TABLES["B'"] = _af_power(MOVE_TABLES['B'], 3)
+    MOVE_TABLES["L'"] = _af_power(MOVE_TABLES['L'], 3)
+    MOVE_TABLES["D'"] = _af_power(MOVE_TABLES['D'], 3)
+
+    @_LazyClassAttribute
+    def MOVES(cls):
+        """The moves, as sympy Permutations."""
+        from sympy.combinatorics import Permutation
+        return {m: Permutation(list(p)) for m, p in cls.MOVE_TABLES.items()}
+
+    @_LazyClassAttribute
+    def GROUP(cls):
+        """The sympy PermutationGroup generated by the face turns."""
+        from sympy.combinatorics import Permutation, PermutationGroup
+        group = PermutationGroup(*(cls.MOVES[m] for m in cls._MOVE_CYCLES))
+        chain = _stabilizer_chain(cls.MOVE_TABLES, cls._MOVE_CYCLES)
+        if chain is not None:
+            # Install the precomputed chain, so sympy skips Schreier-Sims
+            group._base = list(chain.BASE)
+            group._strong_gens = [Permutation._af_new(list(g)) for g in chain.STRONG_GENS]
+            group._basic_orbits = [list(orbit) for orbit in chain.ORBITS]
+            group._transversals = [
+                {beta: Permutation._af_new(list(u)) for beta, u in zip(orbit, us)}
+              for orbit, us in zip(chain.ORBITS, chain.TRANSVERSALS)
+            ]
+            group._order = chain.ORDER
+        return group
+
+    RANKERS = {
+        'cubie': CubieRanker(POLYHEDRON_FACES, _COLOR_INDICES),
+    }
+    RANKERS['coset'] = CosetRanker(  # same order as GROUP.coset_rank
+        lambda: Cube.GROUP, RANKERS['cubie'],
+        chain=_stabilizer_chain(MOVE_TABLES, _MOVE_CYCLES),
+    )
+
+    def rank(self, order='coset'):
+        """Return the index of this state among all 43_252_003_274_489_856_000 legal states.
+
+        order='coset' is the numbering used by the codecs (same as GROUP.coset_rank);
+        order='cubie' numbers states by their cubie coordinates.
+        """
+        return self.RANKERS[order].rank(self.__impl)
+
+    @classmethod
+    def from_rank(cls, rank, order='coset'):
+        """Inverse of rank()."""
+        return cls._from_array(bytes(cls.RANKERS[order].unrank(rank)), rank if order == 'cubie' else None)
+
+    @classmethod
+    def _from_array(cls, p, key=None):
+        # Trusted constructor: p must be a 54-byte array form
+        self = cls.__new__(cls)
+        self.__impl = p
+        self._key = key
+        return self
+
+    def apply(self, moves):
+        """Return the state reached by turning this cube through moves.
+
+        moves is a sequence of names from MOVES, or a string like "R U R' U'".
+        """
+        if isinstance(moves, str):
+            moves = moves.split()
+        p = self.__impl
+        for m in moves:
+            p = self.MOVE_TABLES[m].translate(p + _TRANSLATE_PAD)
+        return self._from_array(p)
+
+    def __mul__(self, other):
+        # Same order as sympy's Permutation.__mul__
+        if not isinstance(other, Cube):
+            return NotImplemented
+        return self._from_array(self.__impl.translate(other.__impl + _TRANSLATE_PAD))
 
-    MOVES["U'"] = MOVES['U']**3
-    MOVES["F'"] = MOVES['F']**3
-    MOVES["R'"] = MOVES['R']**3
-    MOVES["B'"] = MOVES['B']**3
-    MOVES["L'"] = MOVES['L']**3
-    MOVES["D'"] = MOVES['D']**3
+    def __invert__(self):
+        p = self.__impl
+        return self._from_array(bytes(sorted(range(len(p)), key=p.__getitem__)))
 
     @classmethod
-    def _solverstring_to_permutation(cls, s):
-        stickers = [cls._COLOR_LETTERS.index(c) for c in s]
-        p = [None] * cls.GROUP.degree
-
-        _colormap = {
-            # Mapping from SETS of sticker colors
-            frozenset(cls._COLOR_INDICES[i] for i in piece):
-            # to (Mapping from INDIVIDUAL sticker colors to sticker positions)
-            {cls._COLOR_INDICES[i]: i for i in piece}
-          for piece in cls.POLYHEDRON_FACES
-        }
-
-        for cur_piece in cls.POLYHEDRON_FACES:
-            # First, we pick some piece (SAY the Front-Up edge)...
-            # ...and figure out what the hell actually landed in it.
-            cur_colors = {cls._COLOR_LETTERS.index(s[i]) for i in cur_piece}
-            # then, we figure out where these stickers that HAVE landed in our piece
-            # came from originally
-            src_colormap = _colormap[frozenset(cur_colors)]
-            # then we record exactly where each of our stickers came from
-            for cur_index in cur_piece:
-                cur_color = cls._COLOR_LETTERS.index(s[cur_index])
-                assert p[cur_index] is None
-                p[cur_index] = src_colormap[cur_color]
-        assert None not in p
-
-        return sympy.combinatorics.Permutation(p)
+    def _solverstring_tables(cls):
+        # Built on first use, once per class (subclasses may re-color)
+        tables = cls.__dict__.get('_SOLVERSTRING_TABLES')
+        if tables is None:
+            pieces = [tuple(piece) for piece in cls.POLYHEDRON_FACES]
+            solved = ''.join(cls._COLOR_LETTERS[c] for c in cls._COLOR_INDICES)
+            lookup = {
+                # Mapping from the letters found in a slot, in slot order,
+                # to the positions those stickers came from
+                itemgetter(*src)(solved): src
+              for piece in pieces for src in permutations(piece)
+            }
+            getters = tuple(itemgetter(*piece) for piece in pieces)
+            slots = list(chain.from_iterable(pieces))
+            unslot = itemgetter(*(slots.index(i) for i in range(len(cls._COLOR_INDICES))))
+            tables = lookup, getters, unslot
+            cls._SOLVERSTRING_TABLES = tables
+        return tables
+
+    @classmethod
+    def _solverstring_to_array(cls, s):
+        lookup, getters, unslot = cls._solverstring_tables()
+        if len(s) != len(cls._COLOR_INDICES):
+            raise ValueError(f'not a solverstring: {s!r}')
+        try:
+            p = bytes(unslot(tuple(chain.from_iterable(lookup[get(s)] for get in getters))))
+        except KeyError:
+            raise ValueError(f'not a solverstring: {s!r}') from None
+        if len(set(p)) != len(p):
+            raise ValueError(f'not a solverstring (duplicate piece): {s!r}')
+        return p
 
     @property
     def _permutation(self):
+        from sympy.combinatorics import Permutation
+        return Permutation._af_new(list(self.__impl))
+
+    @property
+    def _array(self):
         return self.__impl
 
+    def __reduce__(self):
+        # Pickle legal states as their rank: 9 bytes instead of 54
+        if self.key < 0:
+            return (self.__class__, (self.__impl,))
+        return (self.__class__.from_rank, (self.key, 'cubie'))
+
+    _ALT_STR_ORIENTATIONS = {
+        'rubiks-cube-solver.com': _af_from_cycles([(9, 18), (10, 19), (11, 20), (12, 30, 24, 33, 36, 15, 42, 39, 27), (13, 31, 25, 34, 37, 16, 43, 40, 28), (14, 32, 26, 35, 38, 17, 44, 41, 29)]),
+        'github.com/muodov/kociemba': _af_from_cycles([(9, 12, 24, 33, 51, 39, 30, 48, 27, 45, 15, 36, 18), (10, 13, 25, 34, 52, 40, 31, 49, 28, 46, 16, 37, 19), (11, 14, 26, 35, 53, 41, 32, 50, 29, 47, 17, 38, 20)]),
+    }
+
     def _alt_str(self, version):
         if version == 'rubiks-cube-solver.com':
-            p_mod = sympy.combinatorics.Permutation(53)(9, 18)(10, 19)(11, 20)(12, 30, 24, 33, 36, 15, 42, 39, 27)(13, 31, 25, 34, 37, 16, 43, 40, 28)(14, 32, 26, 35, 38, 17, 44, 41, 29)
-            p = p_mod * self._permutation
+            p = self._ALT_STR_ORIENTATIONS[version].translate(self.__impl + _TRANSLATE_PAD)
             color_letters = ('1', '3', '4', '5', '2', '6')
             return f'https://rubiks-cube-solver.com/solution.php?cube=0{"".join(color_letters[self._COLOR_INDICES[i]] for i in p)}'
         elif version == 'github.com/muodov/kociemba':
-            p_mod = sympy.combinatorics.Permutation(53)(9, 12, 24, 33, 51, 39, 30, 48, 27, 45, 15, 36, 18)(10, 13, 25, 34, 52, 40, 31, 49, 28, 46, 16, 37, 19)(11, 14, 26, 35, 53, 41, 32, 50, 29, 47, 17, 38, 20)
-            p = p_mod * self._permutation
+            p = self._ALT_STR_ORIENTATIONS[version].translate(self.__impl + _TRANSLATE_PAD)
             color_letters = ('U', 'F', 'R', 'B', 'L', 'D')
             return ''.join(color_letters[self._COLOR_INDICES[i]] for i in p)
         raise ValueError(version)
@@ -166,27 +358,29 @@ class Cube:
 
     def __init__(self, initializer=None):
         if initializer is None:
-            p = self.GROUP.identity
+            p = bytes(range(len(self._COLOR_INDICES)))
         elif isinstance(initializer, str):
-            p = self._solverstring_to_permutation(initializer)
-        elif isinstance(initializer, sympy.combinatorics.Permutation):
+            p = self._solverstring_to_array(initializer)
+        elif _is_sympy_permutation(initializer):
             assert initializer in self.GROUP
-            p = initializer
+            p = bytes(initializer.array_form)
         elif isinstance(initializer, int):
-            p = self.GROUP.coset_unrank(initializer)
+            p = bytes(self.RANKERS['coset'].unrank(initializer))
+        elif isinstance(initializer, (bytes, bytearray)):
+            p = bytes(initializer)
+            if sorted(p) != list(range(len(self._COLOR_INDICES))):
+                raise ValueError(f'not an array form: {initializer!r}')
         else:
             raise TypeError(f'Non-Implemented Cube initializer type: {type(initializer)}')
         self.__impl = p
-        self._hash = None
+        self._key = None
 
     def __eq__(self, other):
         if not isinstance(other, Cube):
             return NotImplemented
-        return (self.GROUP, self._permutation) == (other.GROUP, other._permutation)
+        return self.key == other.key and (self.MOVE_TABLES is other.MOVE_TABLES or self.MOVE_TABLES == other.MOVE_TABLES)
 
 
-def _dindex(d, x):
-    try:
-        return next(k for k,v in d.items() if v == x)
-    except StopIteration:
-        raise ValueError(x)
\ No newline at end of file
+def _inverse_move(m):
+    # "U" <-> "U'", "U2" <-> "U2"
+    return m[0] + {'': "'", "'": '', '2': '2'}[m[1:]]
\ No newline at end of file
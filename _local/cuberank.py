@@ -0,0 +1,259 @@
+"""Native rank/unrank of Rubik's Cube states.
+
+States are handled in "array form": a sequence ``p`` of the 54 sticker numbers,
+where ``p[i]`` is the sticker that landed in position ``i`` (the same as
+``sympy.combinatorics.Permutation.array_form``).
+
+Two orderings are provided:
+ - ``CubieRanker`` numbers states by their cubie coordinates
+   (corner permutation, corner orientation, edge permutation, edge orientation)
+ - ``CosetRanker`` reproduces ``group.coset_rank``/``group.coset_unrank``
+   exactly, for compatibility with messages encoded by earlier versions
+"""
+
+__all__ = ['CubieRanker', 'CosetRanker']
+
+from itertools import chain
+from math import factorial
+from operator import itemgetter
+
+
+class CubieRanker:
+    """Rank/unrank cube states by cubie coordinates.
+
+    rank = ((cp * 3**7 + co) * 12!/2 + ep//2) * 2**11 + eo
+
+    where cp and ep are the Lehmer ranks of the corner and edge permutations
+    (the lowest Lehmer digit of ep is implied by the permutation parity) and
+    co and eo are the orientations of all but the last corner and edge.
+    """
+
+    def __init__(self, faces, colors, *, reference_colors=((0, 5), (1, 3))):
+        # faces: the pieces of the puzzle as tuples of sticker numbers (in
+        #  clockwise order, for the corners)
+        # colors: the face each sticker belongs to
+        # reference_colors: the faces whose stickers define the orientation of
+        #  a piece, in order of preference (U/D first, then F/B for the edges)
+        def rotate(piece):
+            for ref in reference_colors:
+                for i, sticker in enumerate(piece):
+                    if colors[sticker] in ref:
+                        return piece[i:] + piece[:i]
+            raise ValueError(piece)
+
+        self._degree = len(colors)
+        self._centers = tuple(piece[0] for piece in faces if len(piece) == 1)
+        self._corners = tuple(rotate(tuple(piece)) for piece in faces if len(piece) == 3)
+        self._edges = tuple(rotate(tuple(piece)) for piece in faces if len(piece) == 2)
+        self._corner_lookup = {
+            # Mapping from the stickers found in a corner slot to (cubie, twist)
+            piece[t:] + piece[:t]: (c, t)
+          for c, piece in enumerate(self._corners) for t in range(3)
+        }
+        self._edge_lookup = {
+            # Mapping from the stickers found in an edge slot to (cubie, flip)
+            piece[t:] + piece[:t]: (e, t)
+          for e, piece in enumerate(self._edges) for t in range(2)
+        }
+        self._pieces_by_sticker = {
+            # Mapping from the sticker found in the first position of a slot
+            # to the stickers found in the whole slot
+            piece[t]: piece[t:] + piece[:t]
+          for piece in self._corners + self._edges for t in range(len(piece))
+        }
+        n_corners = len(self._corners)
+        n_edges = len(self._edges)
+        self._co_radix = 3**(n_corners - 1)
+        self._eo_radix = 2**(n_edges - 1)
+        self._ep_radix = factorial(n_edges) // 2
+        self._order = factorial(n_corners) * self._co_radix * self._ep_radix * self._eo_radix
+
+        # Precompiled accessors, so that ranking does one C-level call per slot
+        self._corner_getters = tuple(itemgetter(*slot) for slot in self._corners)
+        self._edge_getters = tuple(itemgetter(*slot) for slot in self._edges)
+        self._centers_getter = itemgetter(*self._centers)
+        slots = list(chain.from_iterable(self._corners + self._edges)) + list(self._centers)
+        self._unslot = itemgetter(*(slots.index(i) for i in range(self._degree)))
+
+    def order(self):
+        return self._order
+
+    def _coordinates(self, p):
+        """Return the corner permutation and orientation, and edge permutation
+        and orientation, of the state p.
+
+        Raises ValueError if p is not a legal cube state."""
+        try:
+            cp, co = zip(*map(self._corner_lookup.__getitem__, (get(p) for get in self._corner_getters)))
+            ep, eo = zip(*map(self._edge_lookup.__getitem__, (get(p) for get in self._edge_getters)))
+        except KeyError:
+            raise ValueError('not a legal cube state (torn piece)') from None
+        if self._centers_getter(p) != self._centers:
+            raise ValueError('not a legal cube state (moved center)')
+        if sum(co) % 3:
+            raise ValueError('not a legal cube state (corner twist)')
+        if sum(eo) % 2:
+            raise ValueError('not a legal cube state (edge flip)')
+        return cp, co, ep, eo
+
+    def rank(self, p):
+        cp, co, ep, eo = self._coordinates(p)
+        cp_rank, cp_parity = _lehmer_rank(cp)
+        ep_rank, ep_parity = _lehmer_rank(ep)
+        if cp_parity != ep_parity:
+            raise ValueError('not a legal cube state (permutation parity)')
+        co_rank = 0
+        for t in co[:-1]:
+            co_rank = co_rank * 3 + t
+        eo_rank = 0
+        for t in eo[:-1]:
+            eo_rank = eo_rank * 2 + t
+        return ((cp_rank * self._co_radix + co_rank) * self._ep_radix + (ep_rank >> 1)) * self._eo_radix + eo_rank
+
+    def unrank(self, rank):
+        if not 0 <= rank < self._order:
+            raise ValueError(f'rank out of range: {rank}')
+        rank, eo_rank = divmod(rank, self._eo_radix)
+        rank, ep_rank = divmod(rank, self._ep_radix)
+        cp_rank, co_rank = divmod(rank, self._co_radix)
+
+        cp, cp_parity = _lehmer_unrank(cp_rank, len(self._corners))
+        ep, ep_parity = _lehmer_unrank(ep_rank << 1, len(self._edges))
+        if ep_parity != cp_parity:
+            ep[-1], ep[-2] = ep[-2], ep[-1]
+        co = _digits(co_rank, 3, len(self._corners) - 1)
+        co.append(-sum(co) % 3)
+        eo = _digits(eo_rank, 2, len(self._edges) - 1)
+        eo.append(sum(eo) % 2)
+
+        corners = self._corners
+        edges = self._edges
+        return self._assemble(
+            [corners[c][t] for c, t in zip(cp, co)] +
+            [edges[e][t] for e, t in zip(ep, eo)]
+        )
+
+    def _assemble(self, keys):
+        # Build a state from the sticker that landed in the first position of
+        # each corner slot, then each edge slot
+        slotted = tuple(chain.from_iterable(map(self._pieces_by_sticker.__getitem__, keys))) + self._centers
+        return list(self._unslot(slotted))
+
+
+class CosetRanker:
+    """Rank/unrank cube states in the same order as ``group.coset_rank``.
+
+    The stabilizer chain is taken from *chain* if given (anything with
+    BASE, ORBITS and TRANSVERSALS attributes, like _coset_tables), or else
+    from the group on first use; after that, ranking only chases the base
+    points through the transversals and unranking only composes the
+    transversals on one sticker per piece.
+    """
+
+    def __init__(self, get_group, cubie_ranker, *, chain=None):
+        # get_group: a function returning the group (called on first use, so
+        #  that building it can be put off until then)
+        self._get_group = get_group
+        self._chain = chain
+        self._cubie_ranker = cubie_ranker
+        self._tables = None
+
+    def order(self):
+        return self._cubie_ranker.order()
+
+    def _get_tables(self):
+        if self._tables is None:
+            if self._chain is not None:
+                base = self._chain.BASE
+                orbits = self._chain.ORBITS
+                transversals = self._chain.TRANSVERSALS
+            else:
+                group = self._get_group()
+                base = tuple(group.base)
+                orbits = tuple(tuple(orbit) for orbit in group.basic_orbits)
+                transversals = tuple(
+                    tuple(tuple(transversal[beta].array_form) for beta in orbit)
+                  for orbit, transversal in zip(orbits, group.basic_transversals)
+                )
+            inverses = tuple(
+                tuple(tuple(_af_invert(u)) for u in us)
+              for us in transversals
+            )
+            indices = tuple({beta: j for j, beta in enumerate(orbit)} for orbit in orbits)
+            radices = tuple(len(orbit) for orbit in orbits)
+            # One sticker per piece is enough to place every piece
+            ranker = self._cubie_ranker
+            keys = tuple(slot[0] for slot in ranker._corners + ranker._edges)
+            self._tables = base, transversals, inverses, indices, radices, keys
+        return self._tables
+
+    def rank(self, p):
+        # Validate first: sifting only looks at the base points.
+        self._cubie_ranker.rank(p)
+        base, transversals, inverses, indices, radices, keys = self._get_tables()
+        h = [p[b] for b in base]
+        rank = 0
+        b = 1
+        for i in range(len(base)):
+            j = indices[i][h[0]]
+            rank += b * j
+            b *= radices[i]
+            u = inverses[i][j]
+            h = [u[x] for x in h[1:]]
+        return rank
+
+    def unrank(self, rank):
+        base, transversals, inverses, indices, radices, keys = self._get_tables()
+        if not 0 <= rank < self.order():
+            raise ValueError(f'rank out of range: {rank}')
+        us = []
+        for i in range(len(base)):
+            rank, j = divmod(rank, radices[i])
+            us.append(transversals[i][j])
+        # p = us[0] * us[1] * ... * us[-1], evaluated at the keys only
+        h = keys
+        for u in reversed(us):
+            h = [u[x] for x in h]
+        return self._cubie_ranker._assemble(h)
+
+
+def _af_invert(a):
+    inv = [0] * len(a)
+    for i, x in enumerate(a):
+        inv[x] = i
+    return inv
+
+
+def _digits(x, base, n):
+    result = [0] * n
+    for i in reversed(range(n)):
+        x, result[i] = divmod(x, base)
+    return result
+
+
+def _lehmer_rank(perm):
+    """Return the Lehmer rank of perm and its parity."""
+    n = len(perm)
+    rank = 0
+    parity = 0
+    seen = 0
+    for i, x in enumerate(perm):
+        # number of later elements smaller than x
+        d = x - (seen & ((1 << x) - 1)).bit_count()
+        seen |= 1 << x
+        rank = rank * (n - i) + d
+        parity ^= d
+    if seen != (1 << n) - 1:
+        raise ValueError('not a legal cube state (duplicate piece)')
+    return rank, parity & 1
+
+
+def _lehmer_unrank(rank, n):
+    """Inverse of ``_lehmer_rank``."""
+    digits = []
+    for i in range(1, n + 1):
+        rank, d = divmod(rank, i)
+        digits.append(d)
+    available = list(range(n))
+    perm = [available.pop(d) for d in reversed(digits)]
+    return perm, sum(digits) & 1
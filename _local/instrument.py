@@ -0,0 +1,150 @@
+"""Optional instrumentation of the encode/decode pipelines.
+
+Collects, per job: wall time and call count per stage, counters (e.g. the
+number of cubes), and the bit length of the big integers involved.
+
+Enable it either
+ - for a block of code, with the instrument() context manager:
+
+       with instrument('my job', output=print) as job:
+           codec_v2.bytes_to_cubes(data)
+       job.as_dict()
+
+ - or for the whole process, by setting RUBIKSOCKDRIVE_INSTRUMENT before
+   import: every top-level codec call then writes one JSON line, to stderr
+   (RUBIKSOCKDRIVE_INSTRUMENT=1) or appended to the named file.
+
+When neither is active, stage() returns a shared no-op context manager and
+the other hooks return immediately.
+"""
+
+__all__ = ['instrument', 'stage', 'count', 'bits', 'pipeline', 'Job']
+
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from functools import wraps
+import os
+import sys
+from time import perf_counter
+
+ENV_VAR = 'RUBIKSOCKDRIVE_INSTRUMENT'
+_ENV_OUTPUT = os.environ.get(ENV_VAR) or None
+
+_current = ContextVar('_current', default=None)
+_NULL = nullcontext()
+
+
+class Job:
+    """Statistics collected for one instrumented job."""
+
+    def __init__(self, name):
+        self.name = name
+        self.seconds = None
+        self.stages = {}  # stage name -> [calls, seconds]
+        self.counters = {}
+        self.bits = {}
+
+    def as_dict(self):
+        return {
+            'job': self.name,
+            'seconds': self.seconds,
+            'stages': {name: {'calls': calls, 'seconds': seconds} for name, (calls, seconds) in self.stages.items()},
+            'counters': dict(self.counters),
+            'bits': dict(self.bits),
+        }
+
+
+@contextmanager
+def instrument(name='job', *, output=None, profile=None):
+    """Instrument the enclosed code; yields the Job.
+
+    output: a callable to call with the job's dict, or a text file to write
+     it to as one JSON line
+    profile: if given, run the job under cProfile and dump the stats to
+     this path (for pstats / snakeviz)"""
+    job = Job(name)
+    token = _current.set(job)
+    if profile is not None:
+        import cProfile  # deferred: only profiling needs it
+        profiler = cProfile.Profile()
+    else:
+        profiler = None
+    t0 = perf_counter()
+    try:
+        if profiler is not None:
+            profiler.enable()
+        yield job
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(profile)
+        job.seconds = perf_counter() - t0
+        _current.reset(token)
+        if output is not None:
+            _emit(job, output)
+
+
+def _emit(job, output):
+    if callable(output):
+        output(job.as_dict())
+    else:
+        import json  # deferred: only JSON-line output needs it
+        output.write(json.dumps(job.as_dict()) + '\n')
+        output.flush()
+
+
+def stage(name):
+    """Return a context manager timing the enclosed code as stage name."""
+    job = _current.get()
+    if job is None:
+        return _NULL
+    return _stage(job, name)
+
+
+@contextmanager
+def _stage(job, name):
+    t0 = perf_counter()
+    try:
+        yield
+    finally:
+        entry = job.stages.setdefault(name, [0, 0.0])
+        entry[0] += 1
+        entry[1] += perf_counter() - t0
+
+
+def count(name, n=1):
+    job = _current.get()
+    if job is not None:
+        job.counters[name] = job.counters.get(name, 0) + n
+
+
+def bits(name, x):
+    """Record the size of the big integer x (the largest, if called repeatedly)."""
+    job = _current.get()
+    if job is not None:
+        job.bits[name] = max(job.bits.get(name, 0), x.bit_length())
+
+
+def pipeline(name):
+    """Decorator for top-level entry points.
+
+    Inside an instrument() block, the call is timed as a stage; otherwise,
+    if RUBIKSOCKDRIVE_INSTRUMENT is set, it runs as its own job."""
+    def decorator(f):
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            if _current.get() is not None:
+                with stage(name):
+                    return f(*args, **kwargs)
+            if _ENV_OUTPUT is None:
+                return f(*args, **kwargs)
+            with _env_output() as output, instrument(name, output=output):
+                return f(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _env_output():
+    if _ENV_OUTPUT in {'1', 'stderr'}:
+        return nullcontext(sys.stderr)
+    return open(_ENV_OUTPUT, 'a')
@@ -2,18 +2,24 @@
 
 """
 
-__all__ = ['Multiset', 'FrozenMultiset']
+__all__ = ['Multiset', 'SortedMultiset', 'FrozenMultiset']
 
+from bisect import bisect_left, bisect_right, insort
 from collections import Counter
 from collections.abc import Iterable, KeysView, Mapping, MutableSet, Set
 from functools import total_ordering
-from itertools import chain, repeat, starmap
-import logging
+from itertools import accumulate, chain, repeat, starmap
 from math import isqrt
 
 
+def _warn(warning):
+    import logging  # deferred: slow to import, and only needed here
+    logging.warning(warning)
+
 class _MultisetBase:
-    __slots__ = ['__impl']
+    # __impl maps each element to its (positive) multiplicity;
+    # __len is the sum of those multiplicities, kept up to date by every mutator
+    __slots__ = ['__impl', '__len']
 
     def __repr__(self):
         if not self:
@@ -35,30 +41,40 @@ class _MultisetBase:
     def __len__(self):
         # returns the cardinality of the Multiset itself.
         # for the cardinality of the support of the Multiset, use len(_.support()) instead.
-        return sum(self.__impl.values())
+        return self.__len
 
     def count(self, elem):
         return self.__impl.get(elem, 0)
 
     def __init__(self, iterable=()):
-        self.__impl = dict()
         if isinstance(iterable, _MultisetBase):
-            self.__impl.update(iterable.__impl)
+            self.__impl = iterable.__impl.copy()
+            self.__len = iterable.__len
             return
         if isinstance(iterable, Mapping):
             if isinstance(iterable, Counter):
-                logging.warning(DeprecationWarning("Counter passed to Multiset() constructor\nThis behavior is deprecated; call Multiset.fromcounts(items_or_mapping) instead."))
-                self.__impl.update(iterable)
+                _warn(DeprecationWarning("Counter passed to Multiset() constructor\nThis behavior is deprecated; call Multiset.fromcounts(items_or_mapping) instead."))
+                self.__impl = dict(iterable)
+                self.__len = sum(self.__impl.values())
                 return
             else:
-                logging.warning(RuntimeWarning("Mapping passed to Multiset() constructor\nIf you really meant to create a Multiset with just 1 of each key, explicitly call Multiset(mapping.keys()) to suppress this warning; if you meant to create a Multiset initialized with element-quantity pairs, call Multiset.fromcounts(items_or_mapping) instead."))
-        for elem in iterable:
-            _MultisetBase.add(self, elem) # call class method directly to avoid breaking when mutation methods are masked in subclass
+                _warn(RuntimeWarning("Mapping passed to Multiset() constructor\nIf you really meant to create a Multiset with just 1 of each key, explicitly call Multiset(mapping.keys()) to suppress this warning; if you meant to create a Multiset initialized with element-quantity pairs, call Multiset.fromcounts(items_or_mapping) instead."))
+                iterable = iterable.keys()
+        # Counter counts in C; every count it produces is a positive int
+        self.__impl = dict(Counter(iterable))
+        self.__len = sum(self.__impl.values())
+
+    @classmethod
+    def _fromimpl(cls, impl, total=None):
+        # Unchecked constructor: impl must map elements to positive ints, and
+        # is taken over (not copied)
+        self = cls()
+        self.__impl = impl
+        self.__len = sum(impl.values()) if total is None else total
+        return self
 
     def copy(self):
-        result = self.__class__()
-        result.__impl.update(self.__impl)
-        return result
+        return self._fromimpl(self.__impl.copy(), self.__len)
 
     @classmethod
     def fromcounts(cls, items_or_mapping):
@@ -117,9 +133,10 @@ class _MultisetBase:
     def _set(self, elem, count):
         assert isinstance(count, int) and count >= 0
         if count:
+            self.__len += count - self.__impl.get(elem, 0)
             self.__impl[elem] = count
         else:
-            self.__impl.pop(elem, None)
+            self.__len -= self.__impl.pop(elem, 0)
 
     def add(self, elem, _count=1):
         if not isinstance(_count, int):
@@ -145,10 +162,11 @@ class _MultisetBase:
         self._set(elem, result)
 
     def discard(self, elem):
-        self.__impl.pop(elem, None)
+        self.__len -= self.__impl.pop(elem, 0)
 
     def clear(self):
         self.__impl.clear()
+        self.__len = 0
 
     def pop(self):
         try:
@@ -238,7 +256,7 @@ class _MultisetBase:
                 other = Multiset(other)
             else:
                 return NotImplemented
-        if not self.support_len() >= other.support_len():
+        if not len(self.__impl) >= len(other.__impl):
             return False
         self_impl_get = self.__impl.get
         return all(self_impl_get(k, 0) >= v for k, v in other.__impl.items())
@@ -249,8 +267,7 @@ class _MultisetBase:
                 other = Multiset(other)
             else:
                 return NotImplemented
-        other_impl_get = other.__impl.get
-        return self.__class__.fromcounts((k, min(v, other_impl_get(k, 0))) for k, v in self.__impl.items())
+        return self._fromimpl(self.__impl.copy())._inplace_and(other)
 
     def __or__(self, other):
         if not isinstance(other, _MultisetBase):
@@ -258,9 +275,7 @@ class _MultisetBase:
                 other = Multiset(other)
             else:
                 return NotImplemented
-        self_impl_get = self.__impl.get
-        other_impl_get = other.__impl.get
-        return self.__class__.fromcounts((k, max(self_impl_get(k, 0), other_impl_get(k, 0))) for k in set(chain(self.__impl.keys(), other.__impl.keys())))
+        return self._fromimpl(self.__impl.copy(), self.__len)._inplace_or(other)
 
     def __sub__(self, other):
         if not isinstance(other, _MultisetBase):
@@ -268,8 +283,7 @@ class _MultisetBase:
                 other = Multiset(other)
             else:
                 return NotImplemented
-        other_impl_get = other.__impl.get
-        return self.__class__.fromcounts((k, max(0, v - other_impl_get(k, 0))) for k, v in self.__impl.items())
+        return self._fromimpl(self.__impl.copy(), self.__len)._inplace_sub(other)
 
     def __xor__(self, other):
         if not isinstance(other, _MultisetBase):
@@ -277,9 +291,7 @@ class _MultisetBase:
                 other = Multiset(other)
             else:
                 return NotImplemented
-        self_impl_get = self.__impl.get
-        other_impl_get = other.__impl.get
-        return self.__class__.fromcounts((k, abs(self_impl_get(k, 0) - other_impl_get(k, 0))) for k in set(chain(self.__impl.keys(), other.__impl.keys())))
+        return self._fromimpl(self.__impl.copy(), self.__len)._inplace_xor(other)
 
     def __add__(self, other):
         if not isinstance(other, _MultisetBase):
@@ -287,11 +299,70 @@ class _MultisetBase:
                 other = Multiset(other)
             else:
                 return NotImplemented
-        self_impl_get = self.__impl.get
+        return self._fromimpl(self.__impl.copy(), self.__len)._inplace_add(other)
+
+    # Unchecked in-place kernels shared by the binary operators and Multiset's
+    # augmented assignments: other must be a _MultisetBase, and self is
+    # mutated regardless of whether its class is frozen
+
+    def _inplace_and(self, other):
+        impl = self.__impl
         other_impl_get = other.__impl.get
-        return self.__class__.fromcounts((k, self_impl_get(k, 0) + other_impl_get(k, 0)) for k in set(chain(self.__impl.keys(), other.__impl.keys())))
+        for k, v in list(impl.items()):
+            w = other_impl_get(k, 0)
+            if w < v:
+                if w:
+                    impl[k] = w
+                else:
+                    del impl[k]
+                self.__len -= v - w
+        return self
+
+    def _inplace_or(self, other):
+        impl = self.__impl
+        impl_get = impl.get
+        for k, w in list(other.__impl.items()):
+            v = impl_get(k, 0)
+            if w > v:
+                impl[k] = w
+                self.__len += w - v
+        return self
+
+    def _inplace_sub(self, other):
+        impl = self.__impl
+        impl_get = impl.get
+        for k, w in list(other.__impl.items()):
+            v = impl_get(k, 0)
+            if v:
+                if w < v:
+                    impl[k] = v - w
+                    self.__len -= w
+                else:
+                    del impl[k]
+                    self.__len -= v
+        return self
+
+    def _inplace_xor(self, other):
+        impl = self.__impl
+        impl_get = impl.get
+        for k, w in list(other.__impl.items()):
+            v = impl_get(k, 0)
+            if v == w:
+                del impl[k]
+            else:
+                impl[k] = abs(v - w)
+            self.__len += abs(v - w) - v
+        return self
+
+    def _inplace_add(self, other):
+        impl = self.__impl
+        impl_get = impl.get
+        for k, w in list(other.__impl.items()):
+            impl[k] = impl_get(k, 0) + w
+        self.__len += other.__len
+        return self
+
 
-    
 class _MultisetSupportView(KeysView):
     # https://github.com/python/cpython/blob/v3.12.5/Lib/_collections_abc.py#L857
     pass
@@ -313,11 +384,7 @@ class Multiset(_MultisetBase, MutableSet):
                 other = Multiset(other)
             else:
                 return NotImplemented
-        self_impl_get = self._mapping.get
-        self_set = self._set
-        for k, v in list(other._mapping.items()):
-            self_set(k, max(self_impl_get(k, 0), v))
-        return self
+        return self._inplace_or(other)
 
     def __iand__(self, other):
         if not isinstance(other, _MultisetBase):
@@ -325,11 +392,7 @@ class Multiset(_MultisetBase, MutableSet):
                 other = Multiset(other)
             else:
                 return NotImplemented
-        other_impl_get = other._mapping.get
-        self_set = self._set
-        for k, v in list(self._mapping.items()):
-            self_set(k, min(v, other_impl_get(k, 0)))
-        return self
+        return self._inplace_and(other)
 
     def __ixor__(self, other):
         if not isinstance(other, _MultisetBase):
@@ -337,12 +400,7 @@ class Multiset(_MultisetBase, MutableSet):
                 other = Multiset(other)
             else:
                 return NotImplemented
-        self_impl_get = self._mapping.get
-        other_impl_get = other._mapping.get
-        self_set = self._set
-        for k in set(chain(self._mapping.keys(), other._mapping.keys())):
-            self_set(k, abs(self_impl_get(k, 0) - other_impl_get(k, 0)))
-        return self
+        return self._inplace_xor(other)
 
     def __isub__(self, other):
         if not isinstance(other, _MultisetBase):
@@ -350,12 +408,7 @@ class Multiset(_MultisetBase, MutableSet):
                 other = Multiset(other)
             else:
                 return NotImplemented
-        self_impl_get = self._mapping.get
-        other_impl_get = other._mapping.get
-        self_set = self._set
-        for k in set(chain(self.support(), other.support())):
-            self_set(k, max(0, self_impl_get(k, 0) - other_impl_get(k, 0)))
-        return self
+        return self._inplace_sub(other)
 
     def __iadd__(self, other):
         if not isinstance(other, _MultisetBase):
@@ -363,11 +416,100 @@ class Multiset(_MultisetBase, MutableSet):
                 other = Multiset(other)
             else:
                 return NotImplemented
-        self_impl_get = self._mapping.get
-        self_set = self._set
-        for k, v in list(other._mapping.items()):
-            self_set(k, self_impl_get(k, 0) + v)
-        return self
+        return self._inplace_add(other)
+
+
+class SortedMultiset(Multiset):
+    """Multiset whose (mutually comparable) elements are kept in ascending order.
+
+    In addition to everything Multiset does, it supports:
+     - iteration in ascending order
+     - items() for (element, multiplicity) pairs in ascending order
+     - rank() and select() for order statistics in logarithmic time
+
+    Costs, for m distinct elements: adding a new element or removing the last
+    copy of one keeps the sorted support up to date by bisection (plus a list
+    insertion or deletion); other single-element changes are O(1). The running
+    counts behind rank() and select() are recomputed in O(m), without sorting,
+    on the first query after any mutation, and the operators (|, &, -, ^, +
+    and their in-place forms) re-sort the support on the next query. So batch
+    mutations before querying where possible.
+    """
+
+    def __init__(self, iterable=()):
+        self._keys = None  # the sorted support, or None to sort on demand
+        self._below = None  # _below[i] is the number of elements less than _keys[i]
+        super().__init__(iterable)
+
+    def _get_index(self):
+        if self._keys is None:
+            self._keys = sorted(self._mapping)
+            self._below = None
+        if self._below is None:
+            self._below = list(accumulate(map(self._mapping.__getitem__, self._keys), initial=0))
+        return self._keys, self._below
+
+    def items(self):
+        keys, below = self._get_index()
+        return zip(keys, map(self._mapping.__getitem__, keys))
+
+    def __iter__(self):
+        return chain.from_iterable(starmap(repeat, self.items()))
+
+    def rank(self, elem):
+        """Return the number of elements less than elem."""
+        keys, below = self._get_index()
+        return below[bisect_left(keys, elem)]
+
+    def select(self, i):
+        """Return the i-th smallest element, counting from 0."""
+        keys, below = self._get_index()
+        if not 0 <= i < below[-1]:
+            raise IndexError(i)
+        return keys[bisect_right(below, i) - 1]
+
+    # Every mutation invalidates the running counts; single-element ones keep
+    # the sorted support, the rest drop it
+
+    def _set(self, elem, count):
+        keys = self._keys
+        if keys is not None and (elem in self) != (count > 0):
+            if count:
+                insort(keys, elem)
+            else:
+                del keys[bisect_left(keys, elem)]
+        self._below = None
+        super()._set(elem, count)
+
+    def discard(self, elem):
+        if self._keys is not None and elem in self:
+            del self._keys[bisect_left(self._keys, elem)]
+        self._below = None
+        super().discard(elem)
+
+    def clear(self):
+        self._keys = self._below = None
+        super().clear()
+
+    def _inplace_and(self, other):
+        self._keys = self._below = None
+        return super()._inplace_and(other)
+
+    def _inplace_or(self, other):
+        self._keys = self._below = None
+        return super()._inplace_or(other)
+
+    def _inplace_sub(self, other):
+        self._keys = self._below = None
+        return super()._inplace_sub(other)
+
+    def _inplace_xor(self, other):
+        self._keys = self._below = None
+        return super()._inplace_xor(other)
+
+    def _inplace_add(self, other):
+        self._keys = self._below = None
+        return super()._inplace_add(other)
 
 
 class FrozenMultiset(_MultisetBase, Set):
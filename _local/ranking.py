@@ -1,39 +1,177 @@
+from functools import lru_cache
+from math import log2
+import os
+
+
 def octet_rank(s):
-    k = 2**8
-    result = 0
-    for c in s:
-        result *= k
-        result += c + 1
-    return result
+    # Bijective base-256: sum((c + 1) * 256**(n-1-i) for i, c in enumerate(s)),
+    # i.e. the plain base-256 value of s plus 0x0101...01 (n ones).
+    # s may be any bytes-like object (bytearray, memoryview, mmap...),
+    # or any iterable of ints in range(256)
+    if not isinstance(s, bytes):
+        try:
+            s = memoryview(s).cast('B')
+        except TypeError:
+            s = bytes(s)
+    return int.from_bytes(s, 'big') + _octet_bias(len(s))
+
+
+def octet_unrank(i, out=None):
+    """Inverse of octet_rank.
+
+    If out is given, write the result into it -- a writable bytes-like object
+    at least that long, or a file descriptor -- and return its length."""
+    if i == 0:
+        n = 0
+    else:
+        # Find the length n with _octet_bias(n) <= i < _octet_bias(n + 1)
+        n = max(0, (i.bit_length() - 1) // 8)
+        while _octet_bias(n + 1) <= i:
+            n += 1
+        while _octet_bias(n) > i:
+            n -= 1
+    s = (i - _octet_bias(n)).to_bytes(n, 'big')
+    if out is None:
+        return s
+    return _write_out(s, out)
+
 
+def _write_out(s, out):
+    if isinstance(out, int):
+        view = memoryview(s)
+        while view:
+            view = view[os.write(out, view):]
+        return len(s)
+    view = memoryview(out).cast('B')
+    if view.readonly:
+        raise TypeError('out must be writable')
+    if len(view) < len(s):
+        raise ValueError(f'out is too small: {len(s)} bytes needed, {len(view)} available')
+    view[:len(s)] = s
+    return len(s)
 
-def octet_unrank(i):
-    k = 2**8
-    result = []
-    while i != 0:
-        i, c = divmod(i - 1, k)
-        result.append(c)
-    return bytes(reversed(result))
+
+def _octet_bias(n):
+    # Number of byte strings shorter than n, i.e. (256**n - 1) // 255
+    return int.from_bytes(b'\x01' * n, 'big')
 
 
 _A50 = ' ABCDEFGHIJKLMNOPQRSTUVWXYZ\x1E\x1B\t0123456789'
 
 
+# str.translate() tables between _A50 and digit values
+_A50_TO_DIGITS = {ord(c): d for d, c in enumerate(_A50)}
+_DIGITS_TO_A50 = bytes(map(ord, _A50)).ljust(256, b'\0')
+_A50_SET = frozenset(_A50)
+
+
 def str50_rank(s):
-    A = _A50
-    k = len(A)
-    result = 0
-    for c in s:
-        result *= k
-        result += A.index(c) + 1
-    return result
+    # Bijective numeration, same as octet_rank:
+    # the plain base-len(_A50) value of s plus 11...1 (n ones) in that base.
+    # s may also be any iterable of characters
+    if not isinstance(s, str):
+        s = ''.join(s)
+    if not _A50_SET.issuperset(s):
+        raise ValueError(f'not in the str50 alphabet: {sorted(set(s) - _A50_SET)!r}')
+    digits = s.translate(_A50_TO_DIGITS).encode('latin-1')
+    return _digits_to_int(digits, len(_A50)) + _str50_bias(len(s))
 
 
 def str50_unrank(i):
-    A = _A50
-    k = len(A)
-    result = []
-    while i != 0:
-        i, c = divmod(i - 1, k)
-        result.append(c)
-    return ''.join(A[c] for c in reversed(result))
+    if i == 0:
+        return ''
+    # Find the length n with _str50_bias(n) <= i < _str50_bias(n + 1),
+    # starting from an underestimate
+    k = len(_A50)
+    n = max(0, int(i.bit_length() / log2(k)) - 2)
+    bias = _str50_bias(n)
+    while bias * k + 1 <= i:
+        bias = bias * k + 1
+        n += 1
+    digits = _int_to_digits(i - bias, k, n)
+    return digits.translate(_DIGITS_TO_A50).decode('latin-1')
+
+
+def _str50_bias(n):
+    # Number of str50 strings shorter than n, i.e. 11...1 (n ones) in base len(_A50)
+    k = len(_A50)
+    return (k**n - 1) // (k - 1)
+
+
+def _digits_to_int(digits, base):
+    """Return the value of a sequence of base-`base` digits, most significant first.
+
+    Adjacent digits are combined pairwise, and then adjacent pairs, and so on,
+    so that the big multiplications are balanced.
+    """
+    xs = list(digits)
+    b = base
+    while len(xs) > 1:
+        if len(xs) % 2:
+            xs.insert(0, 0)
+        xs = [hi * b + lo for hi, lo in zip(xs[0::2], xs[1::2])]
+        b *= b
+    return xs[0] if xs else 0
+
+
+def _int_to_digits(x, base, n):
+    """Inverse of _digits_to_int: return the n lowest base-`base` digits of x
+    as a bytearray, most significant first."""
+    result = bytearray(n)
+
+    def split(x, start, n):
+        if n <= 32:
+            for i in reversed(range(start, start + n)):
+                x, result[i] = divmod(x, base)
+            return
+        # Split off the largest power-of-two number of low digits
+        j = (n - 1).bit_length() - 1
+        hi, lo = _divmod_power(x, base, j)
+        split(hi, start, n - (1 << j))
+        split(lo, start + n - (1 << j), 1 << j)
+
+    split(x, 0, n)
+    return result
+
+
+def _divmod_power(x, base, j):
+    # divmod(x, base**(2**j)), for x < base**(2**(j+1))
+    p, r, s = _power_reciprocal(base, j)
+    if r is None:
+        return divmod(x, p)
+    # Division by multiplication with the reciprocal, then correction
+    q = (x * r) >> s
+    rem = x - q * p
+    while rem < 0:
+        q -= 1
+        rem += p
+    while rem >= p:
+        q += 1
+        rem -= p
+    return q, rem
+
+
+@lru_cache(maxsize=64)
+def _power_reciprocal(base, j):
+    # Returns (p, r, s) with p = base**(2**j) and r ~= 2**s // p,
+    # or r = None where the builtin divmod is fast enough.
+    p = base if j == 0 else _power_reciprocal(base, j - 1)[0] ** 2
+    if p.bit_length() <= 4096:
+        return p, None, None
+    r, s = _reciprocal(p)
+    return p, r, s
+
+
+def _reciprocal(p):
+    """Return (r, s) with r ~= 2**s // p (within a few units), s = 2 * p.bit_length().
+
+    Newton's method with doubling precision, so the cost is a few
+    multiplications rather than a quadratic long division."""
+    n = p.bit_length()
+    if n <= 4096:
+        return (1 << 2 * n) // p, 2 * n
+    h = n // 2 + 32  # guard bits, so that errors don't compound between levels
+    rh, _ = _reciprocal(p >> (n - h))
+    r = rh << (n - h)
+    e = (1 << 2 * n) - p * r
+    return r + ((r * e) >> (2 * n)), 2 * n
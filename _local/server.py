@@ -0,0 +1,252 @@
+"""Local encode/decode service: python -m _local serve
+
+Keeps the move tables, the stabilizer chain and the solver's tables resident
+(in this process and in each worker), so requests don't pay for imports and
+table construction. The protocol is described in client.py.
+
+Requests of the same kind that arrive within batch_delay of each other are
+coalesced into one batch of at most max_batch requests, and each batch is
+run in the process pool as one task; at most max_pending requests wait for a
+batch, beyond which the server stops reading from the connections that send
+them (backpressure). Per-request latencies are reported by the "stats" op.
+"""
+
+__all__ = ['Server', 'serve']
+
+import asyncio
+from base64 import b64decode, b64encode
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import json
+import os
+from time import perf_counter
+
+from .client import DEFAULT_PORT, LINE_LIMIT
+from .cube import Cube
+from . import codec_v2
+
+BATCHED_OPS = ('encode', 'decode', 'solve')
+
+
+class Server:
+    """The service, not yet listening: see start(), or serve()."""
+
+    def __init__(self, *, workers=None, batch_delay=0.005, max_batch=64, max_pending=1024):
+        # workers: size of the process pool (default: one per CPU); 0 runs
+        #  the batches in a thread instead, e.g. for testing
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.batch_delay = batch_delay
+        self.max_batch = max_batch
+        self.max_pending = max_pending
+        self.stats = _Stats()
+        self._executor = None
+        self._queues = {}
+        self._tasks = []
+        self._server = None
+
+    async def start(self, path=None, *, host='127.0.0.1', port=DEFAULT_PORT):
+        """Listen on the Unix socket at path, or else on host:port."""
+        loop = asyncio.get_running_loop()
+        if self.workers > 0:
+            self._executor = ProcessPoolExecutor(self.workers, initializer=_init_worker)
+            # Start (and warm up) every worker now, rather than on the first requests
+            await asyncio.gather(*(loop.run_in_executor(self._executor, _run_batch, 'encode', [{'data': ''}]) for _ in range(self.workers)))
+        _init_worker()
+        in_flight = asyncio.Semaphore(max(1, self.workers))
+        for op in BATCHED_OPS:
+            self._queues[op] = asyncio.Queue(self.max_pending)
+            self._tasks.append(asyncio.ensure_future(self._batcher(op, in_flight)))
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self._handle, path, limit=LINE_LIMIT)
+        else:
+            self._server = await asyncio.start_server(self._handle, host, port, limit=LINE_LIMIT)
+        return self._server
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._executor is not None:
+            # shutdown() waits for the running batches: not on the event loop
+            await asyncio.to_thread(self._executor.shutdown, cancel_futures=True)
+
+    async def _handle(self, reader, writer):
+        write_lock = asyncio.Lock()
+        responders = set()
+
+        async def respond(response):
+            async with write_lock:
+                writer.write(json.dumps(response).encode('utf-8') + b'\n')
+                await writer.drain()
+
+        async def finish(request_id, op, future, t0):
+            try:
+                result = await future
+            except Exception as e:
+                result = ('error', f'{type(e).__name__}: {e}')
+            status, value = result
+            self.stats.record(op, perf_counter() - t0, status == 'ok')
+            response = {'id': request_id, 'ok': status == 'ok'}
+            response['result' if status == 'ok' else 'error'] = value
+            await respond(response)
+
+        try:
+            while line := await reader.readline():
+                t0 = perf_counter()
+                request_id = op = None
+                try:
+                    request = json.loads(line)
+                    request_id = request.get('id')
+                    op = request.get('op')
+                except (ValueError, AttributeError):
+                    await respond({'id': request_id, 'ok': False, 'error': 'not a JSON object'})
+                    continue
+                if op == 'stats':
+                    await respond({'id': request_id, 'ok': True, 'result': self.stats.as_dict()})
+                elif op in self._queues:
+                    future = asyncio.get_running_loop().create_future()
+                    # Blocks, and so stops reading this connection, while the queue is full
+                    await self._queues[op].put((request, future))
+                    task = asyncio.ensure_future(finish(request_id, op, future, t0))
+                    responders.add(task)
+                    task.add_done_callback(responders.discard)
+                else:
+                    self.stats.record('unknown', perf_counter() - t0, False)
+                    await respond({'id': request_id, 'ok': False, 'error': f'unknown op: {op!r}'})
+            await asyncio.gather(*responders)
+        except ConnectionError:
+            pass
+        finally:
+            for task in responders:
+                task.cancel()
+            writer.close()
+
+    async def _batcher(self, op, in_flight):
+        queue = self._queues[op]
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.batch_delay
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            await in_flight.acquire()
+            self.stats.batches[op] = self.stats.batches.get(op, 0) + 1
+            self.stats.batched[op] = self.stats.batched.get(op, 0) + len(batch)
+            job = loop.run_in_executor(self._executor, _run_batch, op, [request for request, future in batch])
+            job.add_done_callback(lambda job, batch=batch: _deliver(job, batch, in_flight))
+
+
+def _deliver(job, batch, in_flight):
+    in_flight.release()
+    if job.cancelled():
+        results = [('error', 'cancelled')] * len(batch)
+    elif job.exception() is not None:
+        results = [('error', f'{type(job.exception()).__name__}: {job.exception()}')] * len(batch)
+    else:
+        results = job.result()
+    for (request, future), result in zip(batch, results):
+        if not future.done():
+            future.set_result(result)
+
+
+class _Stats:
+
+    def __init__(self, window=1024):
+        self.requests = {}
+        self.errors = {}
+        self.batches = {}
+        self.batched = {}
+        self._latencies = {}  # op -> the most recent window latencies
+        self._window = window
+
+    def record(self, op, seconds, ok):
+        op = str(op)
+        self.requests[op] = self.requests.get(op, 0) + 1
+        if not ok:
+            self.errors[op] = self.errors.get(op, 0) + 1
+        self._latencies.setdefault(op, deque(maxlen=self._window)).append(seconds)
+
+    def as_dict(self):
+        result = {}
+        for op, count in self.requests.items():
+            latencies = sorted(self._latencies[op])
+            result[op] = {
+                'requests': count,
+                'errors': self.errors.get(op, 0),
+                'batches': self.batches.get(op, 0),
+                'mean_batch_size': self.batched[op] / self.batches[op] if self.batches.get(op) else None,
+                'latency_seconds': {
+                    'p50': latencies[len(latencies) // 2],
+                    'p95': latencies[min(len(latencies) - 1, len(latencies) * 95 // 100)],
+                    'max': latencies[-1],
+                },
+            }
+        return result
+
+
+# Worker side
+
+def _init_worker():
+    Cube.from_rank(0)  # builds the rankers' tables
+    Cube().creation_sequence  # loads the solver's tables
+
+
+def _run_batch(op, requests):
+    """Return one (status, value) pair per request; a bad request doesn't
+    spoil the rest of its batch."""
+    results = []
+    for request in requests:
+        try:
+            results.append(('ok', _OPS[op](request)))
+        except Exception as e:
+            results.append(('error', f'{type(e).__name__}: {e}'))
+    return results
+
+
+def _encode(request):
+    if 'text' in request:
+        cs = codec_v2.str50_to_cubes(request['text'])
+    else:
+        cs = codec_v2.bytes_to_cubes(b64decode(request['data'], validate=True))
+    return [str(c) for c in cs]
+
+
+def _decode(request):
+    cs = [Cube(s) for s in _cubes(request)]
+    if request.get('text'):
+        return codec_v2.cubes_to_str50(cs)
+    return b64encode(codec_v2.cubes_to_bytes(cs)).decode('ascii')
+
+
+def _solve(request):
+    # Already in a worker: solve serially
+    return Cube.solve_many([Cube(s) for s in _cubes(request)], workers=1)
+
+
+def _cubes(request):
+    cubes = request['cubes']
+    if not (isinstance(cubes, list) and all(isinstance(s, str) for s in cubes)):
+        raise TypeError('cubes must be a list of solverstrings')
+    return cubes
+
+
+_OPS = {'encode': _encode, 'decode': _decode, 'solve': _solve}
+
+
+async def serve(path=None, *, host='127.0.0.1', port=DEFAULT_PORT, **options):
+    """Run a Server (with these options) until cancelled."""
+    server = Server(**options)
+    listener = await server.start(path, host=host, port=port)
+    try:
+        await listener.serve_forever()
+    finally:
+        await server.close()
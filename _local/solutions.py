@@ -0,0 +1,135 @@
+"""Cache of solver results.
+
+Solving a cube with the two-phase solver takes milliseconds, and the same
+cubes get printed over and over; so solutions are remembered, keyed by the
+solver's facelet string.
+
+There are two layers:
+ - an in-memory LRU, always on
+ - an optional sqlite database, for reuse across runs (see persist())
+"""
+
+__all__ = ['SolutionCache']
+
+from collections import OrderedDict
+import os
+from pathlib import Path
+from threading import Lock
+
+from . import instrument
+
+
+class SolutionCache:
+    """Memoize solve(facelets) -> solution, as whitespace-separated moves."""
+
+    def __init__(self, solve, *, maxsize=4096, path=None, warmup=None):
+        # warmup: a facelet string to solve once in each new worker process
+        #  (loads the solver's tables before any real work arrives)
+        self._solve = solve
+        self._warmup = warmup
+        self._maxsize = maxsize
+        self._lru = OrderedDict()
+        self._lock = Lock()
+        self._db = None
+        if path is not None:
+            self.persist(path)
+
+    @staticmethod
+    def default_path():
+        # $XDG_CACHE_HOME/RubikSockDrive/solutions.sqlite3, or the Windows/macOS moral equivalent
+        if os.name == 'nt':
+            root = os.environ.get('LOCALAPPDATA') or Path.home() / 'AppData' / 'Local'
+        else:
+            root = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+        return Path(root) / 'RubikSockDrive' / 'solutions.sqlite3'
+
+    def persist(self, path=None):
+        """Also store solutions in the sqlite database at path (default: default_path())."""
+        path = Path(path) if path is not None else self.default_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        import sqlite3  # deferred: only the opt-in persistent cache needs it
+        db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        db.execute('CREATE TABLE IF NOT EXISTS solutions (facelets TEXT PRIMARY KEY, solution TEXT NOT NULL)')
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+            self._db = db
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def clear(self):
+        """Forget the in-memory layer (the database, if any, is kept)."""
+        with self._lock:
+            self._lru.clear()
+
+    def __len__(self):
+        return len(self._lru)
+
+    def __call__(self, facelets):
+        solution = self._lookup(facelets)
+        if solution is None:
+            # Solve outside the lock; two threads racing on the same cube
+            # just do the work twice
+            instrument.count('solutions.misses')
+            with instrument.stage('solve'):
+                solution = self._solve(facelets)
+            self._store(facelets, solution)
+        else:
+            instrument.count('solutions.hits')
+        return solution
+
+    def solve_many(self, facelets, *, workers=None):
+        """Return the solutions for each facelet string, in order.
+
+        Cache misses are solved in a pool of worker processes
+        (default: one per CPU)."""
+        facelets = list(facelets)
+        solutions = [self._lookup(f) for f in facelets]
+        todo = list(dict.fromkeys(f for f, s in zip(facelets, solutions) if s is None))
+        instrument.count('solutions.hits', len(facelets) - len(todo))
+        instrument.count('solutions.misses', len(todo))
+        with instrument.stage('solve'):
+            if len(todo) > 1 and workers != 1:
+                from concurrent.futures import ProcessPoolExecutor  # deferred: multiprocessing is slow to import
+                with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(self._solve, self._warmup)) as ex:
+                    solved = dict(zip(todo, ex.map(self._solve, todo)))
+            else:
+                solved = {f: self._solve(f) for f in todo}
+        for f, solution in solved.items():
+            self._store(f, solution)
+        return [s if s is not None else solved[f] for f, s in zip(facelets, solutions)]
+
+    def _lookup(self, facelets):
+        with self._lock:
+            solution = self._lru.get(facelets)
+            if solution is not None:
+                self._lru.move_to_end(facelets)
+                return solution
+            if self._db is not None:
+                row = self._db.execute('SELECT solution FROM solutions WHERE facelets = ?', (facelets,)).fetchone()
+                if row is not None:
+                    solution = row[0]
+                    self._remember(facelets, solution)
+            return solution
+
+    def _store(self, facelets, solution):
+        with self._lock:
+            if self._db is not None:
+                self._db.execute('INSERT OR IGNORE INTO solutions VALUES (?, ?)', (facelets, solution))
+            self._remember(facelets, solution)
+
+    def _remember(self, facelets, solution):
+        # Caller holds the lock
+        self._lru[facelets] = solution
+        self._lru.move_to_end(facelets)
+        while len(self._lru) > self._maxsize:
+            self._lru.popitem(last=False)
+
+
+def _init_worker(solve, warmup):
+    if warmup is not None:
+        solve(warmup)
@@ -0,0 +1,16 @@
+"""Benchmarks for the codec, ranking, Cube and Multiset hot paths.
+
+    python -m benchmarks [--quick] [--filter TEXT] [--output FILE] [--compare BASELINE.json]
+
+Results are printed as JSON: one record per (benchmark, size), with the time
+per call, the throughput, and the peak memory traced during one call.
+"""
+
+from ._harness import BENCHMARKS, benchmark, run
+
+__all__ = ['BENCHMARKS', 'benchmark', 'run']
+
+from . import bench_ranking
+from . import bench_codec
+from . import bench_cube
+from . import bench_multiset
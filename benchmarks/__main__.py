@@ -0,0 +1,50 @@
+import argparse
+import json
+import platform
+import sys
+
+from . import run
+
+
+def main(argv=None):
+  parser = argparse.ArgumentParser(prog='python -m benchmarks', description='Benchmark the codec, ranking, Cube and Multiset hot paths.')
+  parser.add_argument('--quick', action='store_true', help='skip the largest sizes')
+  parser.add_argument('--filter', metavar='TEXT', help='only run benchmarks whose name contains TEXT')
+  parser.add_argument('--min-time', type=float, default=0.2, metavar='SECONDS', help='minimum time per measurement (default: %(default)s)')
+  parser.add_argument('--repeat', type=int, default=3, help='measurements per benchmark; the fastest is kept (default: %(default)s)')
+  parser.add_argument('--output', metavar='FILE', help='write the JSON report to FILE instead of stdout')
+  parser.add_argument('--compare', metavar='BASELINE', help='exit with status 1 if any benchmark is slower than in this earlier report')
+  parser.add_argument('--threshold', type=float, default=1.25, help='slowdown factor counted as a regression (default: %(default)s)')
+  args = parser.parse_args(argv)
+
+  def log(record):
+    print(f"{record['name']:<32} {str(record['size']):>8}  {record['seconds_per_call'] * 1e6:12.1f} us  {record['peak_memory_bytes']:>12,} B", file=sys.stderr)
+
+  results = run(quick=args.quick, name_filter=args.filter, min_time=args.min_time, repeat=args.repeat, log=log)
+  report = {
+    'python': platform.python_implementation() + ' ' + platform.python_version(),
+    'platform': platform.platform(),
+    'results': results,
+  }
+  if args.output:
+    with open(args.output, 'w') as f:
+      json.dump(report, f, indent=1)
+  else:
+    json.dump(report, sys.stdout, indent=1)
+    print()
+
+  if args.compare:
+    with open(args.compare) as f:
+      baseline = {(r['name'], r['size']): r for r in json.load(f)['results']}
+    regressions = 0
+    for r in results:
+      old = baseline.get((r['name'], r['size']))
+      if old is not None and r['seconds_per_call'] > old['seconds_per_call'] * args.threshold:
+        regressions += 1
+        print(f"REGRESSION {r['name']} [{r['size']}]: {old['seconds_per_call'] * 1e6:.1f} us -> {r['seconds_per_call'] * 1e6:.1f} us", file=sys.stderr)
+    return 1 if regressions else 0
+  return 0
+
+
+if __name__ == '__main__':
+  sys.exit(main())
@@ -0,0 +1,92 @@
+"""Minimal benchmark registry and runner (no third-party dependencies)."""
+
+import gc
+from time import perf_counter
+import tracemalloc
+
+__all__ = ['BENCHMARKS', 'benchmark', 'run']
+
+BENCHMARKS = []
+
+
+def benchmark(name, sizes=(None,), *, unit='call', quick_sizes=None):
+    """Register a benchmark.
+
+    The decorated function takes a size and returns (fn, units): a
+    zero-argument callable to time, and how many units (bytes, cubes,
+    elements...) one call processes. quick_sizes, if given, replaces sizes
+    under --quick."""
+    def decorator(setup):
+        BENCHMARKS.append({
+            'name': name,
+            'sizes': tuple(sizes),
+            'quick_sizes': tuple(quick_sizes) if quick_sizes is not None else tuple(sizes),
+            'unit': unit,
+            'setup': setup,
+        })
+        return setup
+    return decorator
+
+
+def _time(fn, min_time, repeat):
+    # Find a number of calls that takes at least min_time, then keep the
+    # best of repeat runs of that many calls
+    number = 1
+    while True:
+        t = _timed_calls(fn, number)
+        if t >= min_time:
+            break
+        number *= 2 if t == 0 else max(2, min(10, int(min_time / t * 1.2) + 1))
+    best = t
+    for _ in range(repeat - 1):
+        best = min(best, _timed_calls(fn, number))
+    return best / number, number
+
+
+def _timed_calls(fn, number):
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        t0 = perf_counter()
+        for _ in range(number):
+            fn()
+        return perf_counter() - t0
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def _peak_memory(fn):
+    # Measured on a separate call: tracing slows everything down
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run(*, quick=False, name_filter=None, min_time=0.2, repeat=3, log=None):
+    """Run the registered benchmarks; return a list of result records."""
+    results = []
+    for bench in BENCHMARKS:
+        if name_filter is not None and name_filter not in bench['name']:
+            continue
+        for size in bench['quick_sizes'] if quick else bench['sizes']:
+            fn, units = bench['setup'](size)
+            fn()  # warm up caches (and lazily built tables) before timing
+            seconds, number = _time(fn, min_time, repeat)
+            record = {
+                'name': bench['name'],
+                'size': size,
+                'unit': bench['unit'],
+                'seconds_per_call': seconds,
+                'calls': number,
+                'throughput': units / seconds if seconds else None,  # units per second
+                'peak_memory_bytes': _peak_memory(fn),
+            }
+            results.append(record)
+            if log is not None:
+                log(record)
+    return results
@@ -0,0 +1,64 @@
+from random import Random
+
+from _local import Cube, codec_v2, codec_v3
+from _local.codec_v2 import _kcomb_to_nat, _nat_to_kcomb, _nat_to_nbag, _nbag_to_nat
+
+from ._harness import benchmark
+
+N = Cube.RANKERS['coset'].order()
+
+CUBE_COUNTS = (16, 256, 1024)
+QUICK_CUBE_COUNTS = (16, 256)
+
+
+def _ranks(k):
+    rng = Random(k)
+    return [rng.randrange(N) for _ in range(k)]
+
+
+@benchmark('codec_v2._nat_to_kcomb', CUBE_COUNTS, unit='element', quick_sizes=QUICK_CUBE_COUNTS)
+def _(k):
+    x = _kcomb_to_nat({j + i for i, j in enumerate(sorted(_ranks(k)))})
+    return (lambda: _nat_to_kcomb(x, k)), k
+
+
+@benchmark('codec_v2._kcomb_to_nat', CUBE_COUNTS, unit='element', quick_sizes=QUICK_CUBE_COUNTS)
+def _(k):
+    s = {j + i for i, j in enumerate(sorted(_ranks(k)))}
+    return (lambda: _kcomb_to_nat(s)), k
+
+
+@benchmark('codec_v2._nat_to_nbag', CUBE_COUNTS, unit='cube', quick_sizes=QUICK_CUBE_COUNTS)
+def _(k):
+    x = _nbag_to_nat(_ranks(k), N)
+    return (lambda: _nat_to_nbag(x, N)), k
+
+
+@benchmark('codec_v2._nbag_to_nat', CUBE_COUNTS, unit='cube', quick_sizes=QUICK_CUBE_COUNTS)
+def _(k):
+    js = _ranks(k)
+    return (lambda: _nbag_to_nat(js, N)), k
+
+
+@benchmark('codec_v2.bytes_to_cubes', (16, 256, 4096), unit='byte', quick_sizes=(16, 256))
+def _(size):
+    s = Random(size).randbytes(size)
+    return (lambda: codec_v2.bytes_to_cubes(s)), size
+
+
+@benchmark('codec_v2.cubes_to_bytes', (16, 256, 4096), unit='byte', quick_sizes=(16, 256))
+def _(size):
+    cs = codec_v2.bytes_to_cubes(Random(size).randbytes(size))
+    return (lambda: codec_v2.cubes_to_bytes(cs)), size
+
+
+@benchmark('codec_v3.bytes_to_cubes', (16, 4096, 65536), unit='byte', quick_sizes=(16, 4096))
+def _(size):
+    s = Random(size).randbytes(size)
+    return (lambda: codec_v3.bytes_to_cubes(s)), size
+
+
+@benchmark('codec_v3.cubes_to_bytes', (16, 4096, 65536), unit='byte', quick_sizes=(16, 4096))
+def _(size):
+    cs = codec_v3.bytes_to_cubes(Random(size).randbytes(size))
+    return (lambda: codec_v3.cubes_to_bytes(cs)), size
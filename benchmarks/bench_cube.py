@@ -0,0 +1,56 @@
+from random import Random
+
+from _local import Cube
+
+from ._harness import benchmark
+
+BATCH = 100
+
+
+def _cubes():
+    rng = Random(0)
+    return [Cube.from_rank(rng.randrange(Cube.RANKERS['cubie'].order()), 'cubie') for _ in range(BATCH)]
+
+
+@benchmark('Cube.rank', ('coset', 'cubie'), unit='cube')
+def _(order):
+    cs = [Cube(str(c)) for c in _cubes()]  # no cached keys
+    return (lambda: [c.rank(order) for c in cs]), BATCH
+
+
+@benchmark('Cube.from_rank', ('coset', 'cubie'), unit='cube')
+def _(order):
+    js = [c.rank(order) for c in _cubes()]
+    return (lambda: [Cube.from_rank(j, order) for j in js]), BATCH
+
+
+@benchmark('Cube()', ('None', 'str', 'bytes', 'int', 'Permutation'), unit='cube')
+def _(kind):
+    cs = _cubes()
+    initializers = {
+        'None': [None] * BATCH,
+        'str': [str(c) for c in cs],
+        'bytes': [c._array for c in cs],
+        'int': [c.rank() for c in cs],
+        'Permutation': [c._permutation for c in cs],
+    }[kind]
+    return (lambda: [Cube(x) for x in initializers]), BATCH
+
+
+@benchmark('Cube.__hash__', unit='cube')
+def _(size):
+    ss = [str(c) for c in _cubes()]
+    # fresh cubes each call, so the key is computed rather than cached
+    return (lambda: [hash(Cube(s)) for s in ss]), BATCH
+
+
+@benchmark('Cube.__repr__', ('cold', 'cached'), unit='cube')
+def _(cache):
+    c = _cubes()[0]
+    repr(c)
+    if cache == 'cold':
+        def fn():
+            Cube.SOLUTIONS.clear()
+            return repr(c)
+        return fn, 1
+    return (lambda: repr(c)), 1
@@ -0,0 +1,71 @@
+import operator
+from random import Random
+
+from _local.multiset42 import Multiset, SortedMultiset
+
+from ._harness import benchmark
+
+SIZES = (1000, 100000)
+QUICK_SIZES = (1000,)
+
+
+def _elements(size, seed=0):
+    # About half the elements repeated
+    rng = Random(seed)
+    return [rng.randrange(size // 2 + 1) for _ in range(size)]
+
+
+@benchmark('Multiset()', SIZES, unit='element', quick_sizes=QUICK_SIZES)
+def _(size):
+    xs = _elements(size)
+    return (lambda: Multiset(xs)), size
+
+
+@benchmark('SortedMultiset()', SIZES, unit='element', quick_sizes=QUICK_SIZES)
+def _(size):
+    xs = _elements(size)
+    return (lambda: SortedMultiset(xs).rank(0)), size
+
+
+@benchmark('Multiset.__len__', SIZES, unit='call', quick_sizes=QUICK_SIZES)
+def _(size):
+    m = Multiset(_elements(size))
+    return (lambda: len(m)), 1
+
+
+def _binary(op):
+    def setup(size):
+        a = Multiset(_elements(size, 0))
+        b = Multiset(_elements(size, 1))
+        return (lambda: op(a, b)), 2 * size
+    return setup
+
+
+for _name, _op in [('+', operator.add), ('|', operator.or_), ('&', operator.and_), ('-', operator.sub), ('^', operator.xor)]:
+    benchmark(f'Multiset {_name}', SIZES, unit='element', quick_sizes=QUICK_SIZES)(_binary(_op))
+
+
+def _inplace(op):
+    def setup(size):
+        a = Multiset(_elements(size, 0))
+        b = Multiset(_elements(size, 1))
+        return (lambda: op(a.copy(), b)), 2 * size
+    return setup
+
+
+for _name, _op in [('+=', operator.iadd), ('|=', operator.ior), ('&=', operator.iand), ('-=', operator.isub), ('^=', operator.ixor)]:
+    benchmark(f'Multiset {_name}', SIZES, unit='element', quick_sizes=QUICK_SIZES)(_inplace(_op))
+
+
+@benchmark('SortedMultiset.rank', SIZES, unit='query', quick_sizes=QUICK_SIZES)
+def _(size):
+    m = SortedMultiset(_elements(size))
+    qs = _elements(1000, 2)
+    return (lambda: [m.rank(q) for q in qs]), len(qs)
+
+
+@benchmark('SortedMultiset.select', SIZES, unit='query', quick_sizes=QUICK_SIZES)
+def _(size):
+    m = SortedMultiset(_elements(size))
+    qs = [i * size // 1000 for i in range(1000)]
+    return (lambda: [m.select(q) for q in qs]), len(qs)
@@ -0,0 +1,41 @@
+from random import Random
+
+from _local.ranking import _A50, octet_rank, octet_unrank, str50_rank, str50_unrank
+
+from ._harness import benchmark
+
+PAYLOAD_SIZES = (16, 256, 4096, 65536, 1 << 20)
+QUICK_PAYLOAD_SIZES = (16, 256, 4096)
+
+
+def _payload(size):
+    return Random(size).randbytes(size)
+
+
+def _text(size):
+    rng = Random(size)
+    return ''.join(rng.choice(_A50) for _ in range(size))
+
+
+@benchmark('octet_rank', PAYLOAD_SIZES, unit='byte', quick_sizes=QUICK_PAYLOAD_SIZES)
+def _(size):
+    s = _payload(size)
+    return (lambda: octet_rank(s)), size
+
+
+@benchmark('octet_unrank', PAYLOAD_SIZES, unit='byte', quick_sizes=QUICK_PAYLOAD_SIZES)
+def _(size):
+    x = octet_rank(_payload(size))
+    return (lambda: octet_unrank(x)), size
+
+
+@benchmark('str50_rank', PAYLOAD_SIZES, unit='char', quick_sizes=QUICK_PAYLOAD_SIZES)
+def _(size):
+    s = _text(size)
+    return (lambda: str50_rank(s)), size
+
+
+@benchmark('str50_unrank', PAYLOAD_SIZES, unit='char', quick_sizes=QUICK_PAYLOAD_SIZES)
+def _(size):
+    x = str50_rank(_text(size))
+    return (lambda: str50_unrank(x)), size
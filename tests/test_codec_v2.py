@@ -0,0 +1,36 @@
+import unittest
+
+from _local import codec_v2
+
+
+class EstimateTest(unittest.TestCase):
+
+    def test_matches_encoding(self):
+        for data in (b'', b'hello', bytes(range(256)) * 3):
+            cubes = len(codec_v2.bytes_to_cubes(data))
+            self.assertEqual(codec_v2.estimate(data)['cubes'], cubes)
+            bounds = codec_v2.estimate(len(data))
+            self.assertLessEqual(bounds['cubes_min'], cubes)
+            self.assertLessEqual(cubes, bounds['cubes_max'])
+
+    def test_huge_length(self):
+        # Beyond sqrt(N) cubes, from logarithms rather than exact arithmetic
+        result = codec_v2.estimate(10**11)
+        self.assertEqual(result['cubes'], 24893384386)
+        with self.assertRaises(ValueError):
+            codec_v2.estimate(10**16)
+
+
+class ManyTest(unittest.TestCase):
+
+    payloads = [b'', b'a', b'hello', bytes(range(256)), b'\0' * 40]
+
+    def test_matches_single(self):
+        for workers in (None, 2):
+            css = codec_v2.bytes_to_cubes_many(self.payloads, workers=workers)
+            self.assertEqual(css, [codec_v2.bytes_to_cubes(s) for s in self.payloads])
+            self.assertEqual(codec_v2.cubes_to_bytes_many(css, workers=workers), self.payloads)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+import os
+import tempfile
+import unittest
+
+from _local import container
+
+
+class ReaderTest(unittest.TestCase):
+
+    def setUp(self):
+        self.data = bytes(range(256))
+        self.path = self._write(container.encode(self.data))
+
+    def _write(self, b):
+        fd, path = tempfile.mkstemp(suffix='.rsdc')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(b)
+        self.addCleanup(os.unlink, path)
+        return path
+
+    def test_round_trip(self):
+        with container.Reader.open(self.path) as r:
+            self.assertEqual(r.decode(), self.data)
+            self.assertEqual(list(r.ranks()), [r[i] for i in range(len(r))])
+
+    def test_close_mid_iteration(self):
+        n = 3 * container._CHUNK_RECORDS  # several chunks
+        r = container.Reader.open(self._write(container.pack_ranks(range(0, 7 * n, 7))))
+        ranks = r.ranks()
+        self.assertEqual([next(ranks) for _ in range(3)], [0, 7, 14])
+        r.close()  # must not raise BufferError
+        self.assertIsNone(r._mmap)
+        with self.assertRaises(ValueError):
+            list(ranks)  # the file is gone
+
+
+if __name__ == '__main__':
+    unittest.main()
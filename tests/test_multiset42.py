@@ -0,0 +1,43 @@
+import random
+import unittest
+
+from _local.multiset42 import Multiset, SortedMultiset
+
+
+class SortedMultisetTest(unittest.TestCase):
+
+    def check(self, ms):
+        expected = sorted(Multiset(ms))  # unordered iteration, sorted independently
+        self.assertEqual(list(ms), expected)
+        for i, elem in enumerate(expected):
+            self.assertEqual(ms.select(i), elem)
+            self.assertEqual(ms.rank(elem), expected.index(elem))
+        with self.assertRaises(IndexError):
+            ms.select(len(expected))
+
+    def test_mutations_between_queries(self):
+        rng = random.Random(0)
+        ms = SortedMultiset(rng.randrange(20) for _ in range(30))
+        for _ in range(300):
+            elem = rng.randrange(25)
+            op = rng.randrange(6)
+            if op == 0:
+                ms.add(elem, rng.randrange(1, 3))
+            elif op == 1 and elem in ms:
+                ms.remove(elem)
+            elif op == 2:
+                ms.discard(elem)
+            elif op == 3:
+                ms |= SortedMultiset([elem, elem + 1])
+            elif op == 4:
+                ms -= Multiset([elem])
+            elif ms:
+                ms.pop()
+            self.check(ms)
+        ms.clear()
+        ms.add(3)
+        self.check(ms)
+
+
+if __name__ == '__main__':
+    unittest.main()